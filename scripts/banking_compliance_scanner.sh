@@ -1,7 +1,7 @@
 #!/bin/bash
 
 # Banking Compliance Scanner
-# Version: 1.1 - Updated for Prowler 5.12.0
+# Version: 1.2 - Scans orchestrated by scan_orchestrator.py
 # Purpose: Orchestrate Prowler scans for banking compliance
 
 set -e
@@ -26,6 +26,12 @@ if [[ "$VIRTUAL_ENV" == "" ]]; then
     fi
 fi
 
+# Use Python from virtual environment if available
+PYTHON_CMD="python3"
+if [ -f "$PROJECT_ROOT/venv/bin/python3" ]; then
+    PYTHON_CMD="$PROJECT_ROOT/venv/bin/python3"
+fi
+
 # Determine Prowler path
 PROWLER_CMD="prowler"
 if ! command -v prowler &> /dev/null; then
@@ -47,141 +53,6 @@ show_banner() {
     echo -e "${NC}"
 }
 
-# Function: Check prerequisites
-check_prerequisites() {
-    echo -e "${YELLOW}[*] Checking prerequisites...${NC}"
-    
-    # Check Prowler
-    if ! $PROWLER_CMD --version &> /dev/null; then
-        echo -e "${RED}[!] Prowler not working. Please run setup.sh${NC}"
-        exit 1
-    fi
-    
-    # Check AWS CLI
-    if ! command -v aws &> /dev/null; then
-        echo -e "${RED}[!] AWS CLI not found. Please install AWS CLI.${NC}"
-        echo "Run: sudo apt install awscli"
-        exit 1
-    fi
-    
-    # Check AWS credentials
-    if ! aws sts get-caller-identity &> /dev/null; then
-        echo -e "${RED}[!] AWS credentials not configured.${NC}"
-        echo "Run: aws configure"
-        exit 1
-    fi
-    
-    echo -e "${GREEN}[✓] All prerequisites met${NC}"
-}
-
-# Function: Run compliance scan
-run_compliance_scan() {
-    local framework=$1
-    local output_name="${framework}_${TIMESTAMP}"
-    
-    echo -e "${YELLOW}[*] Running ${framework} compliance scan...${NC}"
-    
-    case $framework in
-        "pci-dss")
-            $PROWLER_CMD aws \
-                --compliance pci_3.2.1_aws \
-                --output-formats json-ocsf html \
-                --output-directory "$REPORTS_DIR" \
-                --output-filename "$output_name" 
-            ;;
-        "sox")
-            $PROWLER_CMD aws \
-                --compliance soc2_aws \
-                --output-formats json-ocsf html \
-                --output-directory "$REPORTS_DIR" \
-                --output-filename "$output_name" 
-            ;;
-        "cis")
-            $PROWLER_CMD aws \
-                --compliance cis_2.0_aws \
-                --output-formats json-ocsf html \
-                --output-directory "$REPORTS_DIR" \
-                --output-filename "$output_name" 
-            ;;
-        "ffiec")
-            $PROWLER_CMD aws \
-                --compliance ffiec_aws \
-                --output-formats json-ocsf html \
-                --output-directory "$REPORTS_DIR" \
-                --output-filename "$output_name" 
-            ;;
-        "quick-test")
-            # Quick test with just a few checks
-            echo -e "${YELLOW}[*] Running quick test scan (limited checks)...${NC}"
-            $PROWLER_CMD aws \
-                --check iam_root_mfa_enabled iam_password_policy_uppercase s3_bucket_public_access_block \
-                --output-formats json-ocsf html \
-                --output-directory "$REPORTS_DIR" \
-                --output-filename "quick_test_${TIMESTAMP}" 
-            ;;
-        "all-banking")
-            # Run multiple compliance frameworks relevant to banking
-            echo -e "${YELLOW}[*] Running comprehensive banking compliance scan...${NC}"
-            
-            # PCI-DSS
-            echo -e "${YELLOW}Running PCI-DSS checks...${NC}"
-            $PROWLER_CMD aws \
-                --compliance pci_3.2.1_aws \
-                --output-formats json-ocsf \
-                --output-directory "$REPORTS_DIR" \
-                --output-filename "banking_pci_${TIMESTAMP}" 
-            
-            # SOC2
-            echo -e "${YELLOW}Running SOC2 checks...${NC}"
-            $PROWLER_CMD aws \
-                --compliance soc2_aws \
-                --output-formats json-ocsf \
-                --output-directory "$REPORTS_DIR" \
-                --output-filename "banking_soc2_${TIMESTAMP}" 
-            
-            # FFIEC
-            echo -e "${YELLOW}Running FFIEC checks...${NC}"
-            $PROWLER_CMD aws \
-                --compliance ffiec_aws \
-                --output-formats json-ocsf html \
-                --output-directory "$REPORTS_DIR" \
-                --output-filename "banking_comprehensive_${TIMESTAMP}" 
-            ;;
-        *)
-            echo -e "${RED}[!] Unknown framework: $framework${NC}"
-            echo "Available options: pci-dss, sox, cis, ffiec, quick-test, all-banking"
-            return 1
-            ;;
-    esac
-    
-    echo -e "${GREEN}[✓] ${framework} scan completed${NC}"
-}
-
-# Function: Generate summary report
-generate_summary() {
-    echo -e "${YELLOW}[*] Generating executive summary...${NC}"
-    
-    # Use Python from virtual environment if available
-    PYTHON_CMD="python3"
-    if [ -f "$PROJECT_ROOT/venv/bin/python3" ]; then
-        PYTHON_CMD="$PROJECT_ROOT/venv/bin/python3"
-    fi
-    
-    # Find the latest JSON report
-    LATEST_JSON=$(ls -t "$REPORTS_DIR"/*"${TIMESTAMP}"*.ocsf.json 2>/dev/null | head -n1)
-    
-    if [ -z "$LATEST_JSON" ]; then
-        echo -e "${YELLOW}[!] No JSON report found, skipping summary generation${NC}"
-        return
-    fi
-    
-    $PYTHON_CMD "$SCRIPT_DIR/generate_summary.py" \
-        --reports-dir "$REPORTS_DIR" \
-        --timestamp "$TIMESTAMP"
-    
-    echo -e "${GREEN}[✓] Summary generated${NC}"
-}
-
 # Function: List available compliance frameworks
 list_frameworks() {
     echo -e "${GREEN}Available Banking-Relevant Compliance Frameworks:${NC}"
@@ -191,6 +62,16 @@ list_frameworks() {
     echo "  • ffiec      - Federal Financial Institutions Examination Council"
     echo "  • all-banking - Run all banking compliance frameworks"
     echo "  • quick-test - Quick test with minimal checks"
+    echo "  • verify-fixes --baseline <timestamp> - Rescan only the checks that failed in a previous run"
+    echo ""
+    echo "Scan options (passed to scripts/scan_orchestrator.py):"
+    echo "  --regions r1 r2 ...   Scan each region as a separate concurrent shard"
+    echo "  --profiles p1 p2 ...  Scan each AWS profile as a separate shard"
+    echo "  --parallel N          Maximum concurrent Prowler processes (default: 2)"
+    echo "  --job-timeout SECS    Stop any scan running longer than SECS"
+    echo ""
+    echo "Resume an interrupted scan (re-runs only unfinished units):"
+    echo "  --resume <timestamp>"
     echo ""
     echo "To see all available Prowler compliance frameworks:"
     echo "  prowler aws --list-compliance"
@@ -218,18 +99,27 @@ main() {
         exit 0
     fi
     
-    check_prerequisites
-    
-    echo -e "${YELLOW}[*] Running framework: ${FRAMEWORK}${NC}"
+    # Resume an interrupted scan into its original report set
+    SCAN_ARGS=("$FRAMEWORK")
+    if [ "$FRAMEWORK" == "--resume" ]; then
+        TIMESTAMP=${2:-""}
+        if [ -z "$TIMESTAMP" ]; then
+            echo -e "${RED}[!] Usage: $0 --resume <timestamp>${NC}"
+            exit 1
+        fi
+        SCAN_ARGS=(--resume "$TIMESTAMP")
+        shift
+    fi
     
     # Create reports directory if it doesn't exist
     mkdir -p "$REPORTS_DIR"
     
-    # Run scan
-    run_compliance_scan "$FRAMEWORK"
-    
-    # Generate summary
-    generate_summary
+    # Prerequisite checks, scans and summaries run concurrently in the orchestrator
+    $PYTHON_CMD "$SCRIPT_DIR/scan_orchestrator.py" "${SCAN_ARGS[@]}" \
+        --reports-dir "$REPORTS_DIR" \
+        --timestamp "$TIMESTAMP" \
+        --prowler "$PROWLER_CMD" \
+        "${@:2}"
     
     echo -e "${GREEN}"
     echo "════════════════════════════════════════"
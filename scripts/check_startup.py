@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Report CLI startup check
+Times compliance_report.py against a bare interpreter start and checks that
+heavy or unused modules stay out of its import path. Run locally or in CI.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CLI = SCRIPTS_DIR / 'compliance_report.py'
+
+# Budgets are seconds on top of a bare interpreter start, so they track the
+# CLI's own cost; importing NumPy alone adds ~0.15s
+HELP_BUDGET = 0.06     # --help
+COMMAND_BUDGET = 0.10  # summary --help
+SUMMARY_BUDGET = 0.15  # summary of a 200-finding report
+
+# Modules that must not be loaded for each command
+HEAVY = {'numpy', 'concurrent.futures', 'boto3'}
+SUBCOMMANDS = {'generate_summary', 'generate_html_dashboard', 'verify_fixes', 'debug_ocsf'}
+
+# Runs the CLI in-process and reports sys.modules on stderr
+IMPORT_PROBE = """
+import json, sys
+sys.path.insert(0, {scripts!r})
+import compliance_report
+try:
+    compliance_report.main(sys.argv[1:])
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps(sorted(sys.modules)))
+"""
+
+
+def timed(cmd, runs=5):
+    """Best wall time of several runs"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def loaded_modules(args):
+    probe = IMPORT_PROBE.format(scripts=str(SCRIPTS_DIR))
+    result = subprocess.run([sys.executable, '-c', probe] + args, check=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return set(json.loads(result.stderr.strip().splitlines()[-1]))
+
+
+def write_sample_report(reports_dir, timestamp, findings=200):
+    with open(Path(reports_dir) / f"startup_{timestamp}.ocsf.json", 'w') as f:
+        for i in range(findings):
+            f.write(json.dumps({
+                'status_code': 1 + i % 2, 'severity_id': 1 + i % 5,
+                'metadata': {'event_code': f'check_{i % 10}'},
+                'resources': [{'uid': f'arn:aws:s3:::bucket-{i}', 'type': 'AwsS3Bucket'}],
+                'cloud': {'account': {'uid': '123456789012'}, 'region': 'us-east-1'},
+            }) + '\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check report CLI startup time and imports')
+    parser.add_argument('--runs', type=int, default=5, help='Timing runs per command (best is kept)')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as reports_dir:
+        return run_checks(reports_dir, args.runs)
+
+
+def run_checks(reports_dir, runs):
+    timestamp = '20250101_000000'
+    write_sample_report(reports_dir, timestamp)
+
+    # name -> (CLI arguments, budget, modules that must not be loaded)
+    commands = {
+        '--help': (['--help'], HELP_BUDGET, HEAVY | SUBCOMMANDS),
+        'summary --help': (['summary', '--help'], COMMAND_BUDGET, HEAVY | (SUBCOMMANDS - {'generate_summary'})),
+        # Writing the summary set uses a thread pool, so concurrent.futures is allowed
+        'summary (200 findings)': (['summary', '--reports-dir', reports_dir, '--timestamp', timestamp],
+                                   SUMMARY_BUDGET, (HEAVY - {'concurrent.futures'}) |
+                                   (SUBCOMMANDS - {'generate_summary'})),
+    }
+
+    baseline = timed([sys.executable, '-c', 'pass'], runs)
+    print(f"interpreter start: {baseline:.3f}s")
+    failed = False
+    for name, (cli_args, budget, forbidden) in commands.items():
+        overhead = timed([sys.executable, str(CLI)] + cli_args, runs) - baseline
+        status = 'OK' if overhead <= budget else 'OVER BUDGET'
+        failed |= overhead > budget
+        print(f"{name}: +{overhead:.3f}s (budget +{budget}s) {status}")
+
+        unexpected = sorted(forbidden & loaded_modules(cli_args))
+        if unexpected:
+            failed = True
+            print(f"{name}: unexpected imports: {', '.join(unexpected)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Banking Compliance Report CLI
+Single entry point for the report scripts. Each subcommand imports its
+module only when it runs, so --help and small reports start quickly.
+"""
+
+import argparse
+import sys
+from importlib import import_module
+
+# subcommand -> (module, help text)
+COMMANDS = {
+    'summary': ('generate_summary', 'Generate executive summaries from OCSF reports'),
+    'dashboard': ('generate_html_dashboard', 'Generate the HTML compliance dashboard'),
+    'diff': ('verify_fixes', 'Compare a rescan against a baseline scan'),
+    'inspect': ('debug_ocsf', 'Show the structure and pass/fail counts of an OCSF report'),
+}
+
+
+def run_dashboard(module, argv):
+    parser = argparse.ArgumentParser(prog='compliance_report.py dashboard',
+                                     description=COMMANDS['dashboard'][1])
+    parser.parse_args(argv)
+    module.generate_html_dashboard()
+
+
+# Modules without a main(argv) entry point
+RUNNERS = {
+    'dashboard': run_dashboard,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='compliance_report.py',
+        description='Banking compliance report tools',
+        epilog='Run "<command> --help" for command options.'
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>')
+    for name, (_, help_text) in COMMANDS.items():
+        # Options are parsed by the subcommand's own parser
+        subparsers.add_parser(name, help=help_text, add_help=False)
+
+    args, rest = parser.parse_known_args(argv)
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    module = import_module(COMMANDS[args.command][0])
+    runner = RUNNERS.get(args.command)
+    if runner:
+        runner(module, rest)
+    else:
+        module.main(rest)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
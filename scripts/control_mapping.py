@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Compliance control mapping for banking compliance summaries
+Maps Prowler OCSF findings to framework requirements (PCI, SOC2, FFIEC, CIS)
+and rolls up pass/fail per control for every framework in a single pass
+"""
+
+class ControlIndex:
+    """Finding -> framework control index with per-control rollups
+
+    Prowler records the requirements each check satisfies under
+    `unmapped.compliance` as {framework: [requirement ids]}. The mapping
+    is identical for every finding of a check, so it is resolved once per
+    check ID and reused for the rest of the scan.
+    """
+
+    def __init__(self, frameworks=None):
+        # Optional allow-list of framework names (case-insensitive prefix match)
+        self.frameworks = [f.lower() for f in frameworks] if frameworks else None
+        # check ID -> control pairs; per index, since Prowler versions can map
+        # the same check differently across scans
+        self.check_controls = {}
+        self.rollups = {}
+
+    def _wanted(self, framework):
+        if self.frameworks is None:
+            return True
+        name = framework.lower()
+        return any(name.startswith(prefix) for prefix in self.frameworks)
+
+    def controls_for(self, finding):
+        """Return the (framework, control) pairs a finding maps to"""
+        metadata = finding.get('metadata') or {}
+        check_id = metadata.get('event_code', '')
+
+        if check_id and check_id in self.check_controls:
+            return self.check_controls[check_id]
+
+        compliance = (finding.get('unmapped') or {}).get('compliance') or {}
+        controls = []
+        for framework, requirements in compliance.items():
+            if not self._wanted(framework):
+                continue
+            if isinstance(requirements, str):
+                requirements = [requirements]
+            for requirement in requirements or []:
+                controls.append((framework, str(requirement)))
+
+        controls = tuple(controls)
+        if check_id:
+            self.check_controls[check_id] = controls
+        return controls
+
+    def add(self, finding):
+        """Record a finding's status against every control it maps to"""
+        status = finding.get('status_code')
+        if status not in (1, 2):
+            return
+
+        field = 'passed' if status == 1 else 'failed'
+        for framework, control in self.controls_for(finding):
+            controls = self.rollups.setdefault(framework, {})
+            counts = controls.get(control)
+            if counts is None:
+                counts = controls[control] = {'passed': 0, 'failed': 0}
+            counts[field] += 1
+
+    def to_dict(self):
+        """Per-framework control matrices with a control-level score"""
+        result = {}
+        for framework in sorted(self.rollups):
+            controls = self.rollups[framework]
+            matrix = {}
+            failed_controls = 0
+            for control in sorted(controls):
+                counts = controls[control]
+                status = 'FAIL' if counts['failed'] else 'PASS'
+                if status == 'FAIL':
+                    failed_controls += 1
+                matrix[control] = {
+                    'passed': counts['passed'],
+                    'failed': counts['failed'],
+                    'status': status
+                }
+
+            total = len(matrix)
+            passed_controls = total - failed_controls
+            result[framework] = {
+                'total_controls': total,
+                'passed_controls': passed_controls,
+                'failed_controls': failed_controls,
+                'control_score': round((passed_controls / total) * 100, 2) if total else 100,
+                'controls': matrix
+            }
+        return result
@@ -85,10 +85,11 @@ def analyze_ocsf(filename):
     print(f"  Failed: {failed}")
     print(f"  Unknown: {total_lines - passed - failed}")
 
-if __name__ == "__main__":
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
     # Find the OCSF file
-    if len(sys.argv) > 1:
-        analyze_ocsf(sys.argv[1])
+    if argv:
+        analyze_ocsf(argv[0])
     else:
         # Find latest OCSF file
         reports_dir = Path("reports")
@@ -98,3 +99,6 @@ if __name__ == "__main__":
             analyze_ocsf(latest)
         else:
             print("No OCSF files found")
+
+if __name__ == "__main__":
+    main()
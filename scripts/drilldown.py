@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Per-account and per-region drill-down for banking compliance summaries
+Accumulates score, severity and category counts for every account and region
+while findings are counted, and writes them as a sharded summary set
+"""
+
+import re
+from pathlib import Path
+
+from merge_findings import finding_key
+
+DIMENSIONS = ('accounts', 'regions')
+
+# Groups for findings without an account or region; top offenders use the same
+UNKNOWN_ACCOUNT = 'unknown'
+GLOBAL_REGION = 'global'
+
+
+def finding_groups(finding, key=None):
+    """(account, region) a finding belongs to; key is its finding_key if already known"""
+    region = (key or finding_key(finding))[2]
+    account = ((finding.get('cloud') or {}).get('account') or {}).get('uid')
+    return account or UNKNOWN_ACCOUNT, region or GLOBAL_REGION
+
+
+def shard_name(key):
+    """Filesystem-safe shard file name for a group key"""
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', str(key)) + '.json'
+
+
+class GroupAggregates:
+    """Grouped pass/fail, severity and category counters
+
+    Findings are mapped to a small integer row per account and region;
+    tally_findings counts each dimension into per-row grids alongside the
+    global totals, so the counters grow with the number of accounts and
+    regions rather than with the number of findings.
+    """
+
+    def __init__(self, severity_levels, category_names):
+        self.severity_levels = tuple(severity_levels)
+        self.category_names = list(category_names)
+        # dimension -> group key -> row in that dimension's grids
+        self.rows = {dim: {} for dim in DIMENSIONS}
+        # dimension -> (passed counts, severity counts, category counts) per row
+        self.grids = {}
+
+    def group_codes(self, findings, keys=None):
+        """Per-dimension lists holding each finding's group row
+
+        keys are the findings' finding_groups if already known.
+        """
+        if keys is None:
+            keys = [finding_groups(finding) for finding in findings]
+        codes = {}
+        for i, dim in enumerate(DIMENSIONS):
+            rows = self.rows[dim]
+            codes[dim] = [rows.setdefault(key[i], len(rows)) for key in keys]
+        return codes
+
+    def size(self, dim):
+        return len(self.rows[dim])
+
+    def load(self, dim, passed_counts, severity_counts, category_counts):
+        """Store a dimension's per-row counters; failures are the severity row totals"""
+        self.grids[dim] = (passed_counts, severity_counts, category_counts)
+
+    def to_dict(self, score_fn, grade_fn, severity_weights):
+        """Per-group summaries keyed by dimension and group key"""
+        result = {}
+        for dim in DIMENSIONS:
+            result[dim] = {}
+            passed_counts, severity_counts, category_counts = self.grids.get(dim, ([], [], []))
+            for key, row in sorted(self.rows[dim].items()):
+                passed, severities, categories = passed_counts[row], severity_counts[row], category_counts[row]
+                failed = sum(severities)
+                score = score_fn(passed, failed)
+                severity = {level: severities[i] for i, level in enumerate(self.severity_levels)}
+                severity['weighted'] = sum(severities[i] * severity_weights[level]
+                                           for i, level in enumerate(self.severity_levels))
+                result[dim][key] = {
+                    'overall_risk_score': score,
+                    'compliance_grade': grade_fn(score),
+                    'passed_checks': passed,
+                    'failed_checks': failed,
+                    'severity': severity,
+                    'categories': {name: categories[i] for i, name in enumerate(self.category_names)}
+                }
+        return result
+
+
+def shard_documents(drilldown, output_dir, label):
+    """(path, payload) pairs for the shard set plus its index
+
+    Layout: <output_dir>/index.json, accounts/<account>.json, regions/<region>.json.
+    Dashboards read the index and load only the shards they display.
+    """
+    output_dir = Path(output_dir)
+    documents = []
+    index = {'label': label}
+    for dim in DIMENSIONS:
+        (output_dir / dim).mkdir(parents=True, exist_ok=True)
+        entries = []
+        for key, group in drilldown.get(dim, {}).items():
+            shard = f"{dim}/{shard_name(key)}"
+            documents.append((output_dir / shard, dict(group, key=key, dimension=dim)))
+            entries.append({
+                'key': key,
+                'shard': shard,
+                'overall_risk_score': group['overall_risk_score'],
+                'compliance_grade': group['compliance_grade'],
+                'failed_checks': group['failed_checks']
+            })
+        index[dim] = entries
+    documents.append((output_dir / 'index.json', index))
+    return documents
@@ -4,17 +4,118 @@ Banking Compliance Summary Generator
 Processes Prowler OCSF outputs and creates executive dashboards
 """
 
+import glob
 import json
 import os
+import re
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 import argparse
 
+from control_mapping import ControlIndex
+from drilldown import DIMENSIONS, GroupAggregates, finding_groups, shard_documents
+from hotspots import HotspotIndex
+from merge_findings import finding_key
+from report_writer import render_json, write_atomic, write_documents
+
+# NumPy is optional and slow to import; it is only loaded for reports large
+# enough for vectorized counting to pay for the import
+NUMPY_MIN_FINDINGS = 5000
+_numpy = None
+
+
+def load_numpy():
+    """Import NumPy on first use; None when it is not installed"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+# Severities counted in the summary, in report order
+SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low')
+
+# OCSF severity_id -> severity name
+OCSF_SEVERITY_IDS = {
+    0: 'unknown',
+    1: 'informational',
+    2: 'low',
+    3: 'medium',
+    4: 'high',
+    5: 'critical',
+    6: 'critical'  # Fatal
+}
+
+# severity_id -> index in SEVERITY_LEVELS (len() if not counted). The last
+# entry stands for any out-of-range id; -1 marks a missing severity_id, whose
+# severity is looked up per finding by get_severity_from_ocsf
+SEVERITY_ID_CODES = tuple(
+    -1 if severity_id == 0 else
+    SEVERITY_LEVELS.index(name) if name in SEVERITY_LEVELS else len(SEVERITY_LEVELS)
+    for severity_id, name in sorted(OCSF_SEVERITY_IDS.items())
+) + (len(SEVERITY_LEVELS),)
+
+# Keyword mapping for banking categories
+BANKING_KEYWORDS = {
+    'Data Protection': ['s3', 'backup', 'snapshot', 'retention', 'database', 'rds', 'ebs', 'storage'],
+    'Access Control': ['iam', 'mfa', 'password', 'access', 'role', 'user', 'group', 'policy', 'permission'],
+    'Encryption': ['encrypt', 'kms', 'tls', 'ssl', 'certificate', 'crypto', 'key'],
+    'Audit & Logging': ['cloudtrail', 'log', 'audit', 'monitor', 'config', 'cloudwatch', 'trail'],
+    'Network Security': ['vpc', 'security', 'nacl', 'firewall', 'network', 'subnet', 'gateway', 'route'],
+    'Incident Response': ['guardduty', 'alarm', 'sns', 'incident', 'detective', 'alert']
+}
+
+# Compiled once per process; categories are tried in order, first match wins
+CATEGORY_PATTERNS = [
+    (category, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+    for category, keywords in BANKING_KEYWORDS.items()
+]
+
+OCSF_SUFFIX = '.ocsf.json'
+
+# Frameworks whose control tables are written to the Markdown summary by default
+MARKDOWN_FRAMEWORKS = ('ffiec', 'pci', 'soc2', 'cis')
+
+
+def classify_text(search_text):
+    """Banking category for a finding's lowercased search text"""
+    for category, pattern in CATEGORY_PATTERNS:
+        if pattern.search(search_text):
+            return category
+    
+    # Default category if not matched
+    # Try to determine based on service
+    if 'cloudtrail' in search_text:
+        return 'Audit & Logging'
+    elif 'iam' in search_text:
+        return 'Access Control'
+    elif 'config' in search_text:
+        return 'Audit & Logging'
+    return 'Network Security'
+
+
+def report_label(path):
+    """Summary label for an OCSF file: its name without the .ocsf.json suffix"""
+    name = Path(path).name
+    return name[:-len(OCSF_SUFFIX)] if name.endswith(OCSF_SUFFIX) else Path(path).stem
+
 class ComplianceSummaryGenerator:
-    def __init__(self, reports_dir, timestamp):
+    def __init__(self, reports_dir, timestamp, top_n=10, hotspot_capacity=1000, frameworks=None,
+                 use_numpy=True, compact_json=False, write_workers=2, drilldown=True):
         self.reports_dir = Path(reports_dir)
         self.timestamp = timestamp
+        self.top_n = top_n
+        self.hotspot_capacity = hotspot_capacity
+        self.frameworks = frameworks
+        self.use_numpy = use_numpy
+        self.compact_json = compact_json
+        self.write_workers = write_workers
+        self.drilldown = drilldown
         self.severity_weights = {
             'critical': 10,
             'high': 7,
@@ -45,19 +146,11 @@ class ComplianceSummaryGenerator:
     
     def calculate_risk_score(self, findings):
         """Calculate risk score for banking environment"""
-        passed = 0
-        failed = 0
-        
-        for finding in findings:
-            # OCSF format uses 'status_code'
-            # 1 = Success (Pass), 2 = Failure (Fail)
-            status = finding.get('status_code', 0) if isinstance(finding, dict) else 0
-            
-            if status == 1:
-                passed += 1
-            elif status == 2:
-                failed += 1
-        
+        counts = self.tally_findings(findings)
+        return self.score_from_counts(counts['passed'], counts['failed'])
+    
+    def score_from_counts(self, passed, failed):
+        """Risk score from pass/fail counts"""
         total = passed + failed
         if total == 0:
             return 100
@@ -68,24 +161,7 @@ class ComplianceSummaryGenerator:
     
     def categorize_banking_findings(self, findings):
         """Categorize findings by banking domain"""
-        categories = {
-            'Data Protection': [],
-            'Access Control': [],
-            'Encryption': [],
-            'Audit & Logging': [],
-            'Network Security': [],
-            'Incident Response': []
-        }
-        
-        # Keyword mapping for banking categories
-        keyword_map = {
-            'Data Protection': ['s3', 'backup', 'snapshot', 'retention', 'database', 'rds', 'ebs', 'storage'],
-            'Access Control': ['iam', 'mfa', 'password', 'access', 'role', 'user', 'group', 'policy', 'permission'],
-            'Encryption': ['encrypt', 'kms', 'tls', 'ssl', 'certificate', 'crypto', 'key'],
-            'Audit & Logging': ['cloudtrail', 'log', 'audit', 'monitor', 'config', 'cloudwatch', 'trail'],
-            'Network Security': ['vpc', 'security', 'nacl', 'firewall', 'network', 'subnet', 'gateway', 'route'],
-            'Incident Response': ['guardduty', 'alarm', 'sns', 'incident', 'detective', 'alert']
-        }
+        categories = {category: [] for category in BANKING_KEYWORDS}
         
         for finding in findings:
             if not isinstance(finding, dict):
@@ -125,24 +201,7 @@ class ComplianceSummaryGenerator:
             search_text += message.lower()
             
             # Categorize based on keywords
-            categorized = False
-            for category, keywords in keyword_map.items():
-                if any(keyword in search_text for keyword in keywords):
-                    categories[category].append(finding)
-                    categorized = True
-                    break
-            
-            # Default category if not matched
-            if not categorized:
-                # Try to determine based on service
-                if 'cloudtrail' in search_text:
-                    categories['Audit & Logging'].append(finding)
-                elif 'iam' in search_text:
-                    categories['Access Control'].append(finding)
-                elif 'config' in search_text:
-                    categories['Audit & Logging'].append(finding)
-                else:
-                    categories['Network Security'].append(finding)
+            categories[classify_text(search_text)].append(finding)
         
         return categories
     
@@ -153,16 +212,7 @@ class ComplianceSummaryGenerator:
         # First try severity_id
         severity_id = finding.get('severity_id', 0)
         if severity_id:
-            severity_map = {
-                0: 'unknown',
-                1: 'informational',
-                2: 'low',
-                3: 'medium',
-                4: 'high',
-                5: 'critical',
-                6: 'critical'  # Fatal
-            }
-            return severity_map.get(severity_id, 'unknown')
+            return OCSF_SEVERITY_IDS.get(severity_id, 'unknown')
         
         # Then try severity field
         severity = finding.get('severity', '')
@@ -178,62 +228,181 @@ class ComplianceSummaryGenerator:
         
         return 'medium'  # Default
     
+    def severity_code(self, finding):
+        """Index of a finding's severity in SEVERITY_LEVELS (len() if not counted)"""
+        severity = self.get_severity_from_ocsf(finding)
+        if severity in SEVERITY_LEVELS:
+            return SEVERITY_LEVELS.index(severity)
+        return len(SEVERITY_LEVELS)
+    
+    def tally_findings(self, findings, categories=None, groups=None, hotspots=None):
+        """Count pass/fail, failed severities and per-category severities
+        
+        Failures are taken from the category lists, which already hold them
+        grouped by category, and only their raw severity_id is read. Those ids
+        are mapped through SEVERITY_ID_CODES and counted vectorized over NumPy
+        arrays when available; only failures without a usable severity_id fall
+        back to the per-finding lookup. When `groups` is given, per-account and
+        per-region counters are filled as well; when `hotspots` is given, failures
+        are added to it. Both share each failure's finding_key and groups.
+        """
+        category_names = list(categories or {})
+        rows = [finding for finding in findings if isinstance(finding, dict)]
+        
+        # OCSF format uses 'status_code'
+        # 1 = Success (Pass), 2 = Failure (Fail)
+        statuses = Counter(finding.get('status_code') for finding in rows)
+        passed = sum(count for status, count in statuses.items() if status == 1)
+        
+        # Every failure lands in exactly one category; without categories they
+        # are all counted as uncategorized
+        if categories:
+            failed_rows = [finding for name in category_names for finding in categories[name]]
+            category_sizes = [len(categories[name]) for name in category_names] + [0]
+        else:
+            failed_rows = [finding for finding in rows if finding.get('status_code') == 2]
+            category_sizes = [len(failed_rows)]
+        
+        severity_ids = [finding.get('severity_id') for finding in failed_rows]
+        # Clamp into SEVERITY_ID_CODES here, before NumPy sees them: JSON ints can
+        # exceed int64. Non-integer ids take the per-finding path, like a missing one
+        top = len(SEVERITY_ID_CODES) - 1
+        severity_ids = [min(max(severity_id, 0), top) if type(severity_id) is int else 0
+                        for severity_id in severity_ids]
+        
+        if groups is not None or hotspots is not None:
+            failed_keys = [finding_key(finding) for finding in failed_rows]
+            failed_groups = [finding_groups(finding, key) for finding, key in zip(failed_rows, failed_keys)]
+        if hotspots is not None:
+            for finding, key, group in zip(failed_rows, failed_keys, failed_groups):
+                hotspots.add(finding, key, group)
+        
+        group_codes = {}
+        if groups is not None:
+            passed_rows = [finding for finding in rows if finding.get('status_code') == 1]
+            failed_codes = groups.group_codes(failed_rows, failed_groups)
+            passed_codes = groups.group_codes(passed_rows)
+            group_codes = {dim: (groups.size(dim), failed_codes[dim], passed_codes[dim]) for dim in DIMENSIONS}
+        
+        np = load_numpy() if self.use_numpy and len(rows) >= NUMPY_MIN_FINDINGS else None
+        tally = self._tally_numpy if np is not None else self._tally_python
+        grid, group_grids = tally(np, failed_rows, severity_ids, category_sizes, group_codes)
+        for dim, grids in group_grids.items():
+            groups.load(dim, *grids)
+        
+        weights = [self.severity_weights[level] for level in SEVERITY_LEVELS]
+        
+        def severity_dict(row):
+            counts = {level: row[i] for i, level in enumerate(SEVERITY_LEVELS)}
+            counts['weighted'] = sum(row[i] * weights[i] for i in range(len(SEVERITY_LEVELS)))
+            return counts
+        
+        totals = [sum(row[i] for row in grid) for i in range(len(SEVERITY_LEVELS) + 1)]
+        return {
+            'passed': passed,
+            'failed': len(failed_rows),
+            'severity': severity_dict(totals),
+            'categories': {name: severity_dict(grid[code]) for code, name in enumerate(category_names)}
+        }
+    
+    def _tally_numpy(self, np, failed_rows, severity_ids, category_sizes, group_codes):
+        width = len(SEVERITY_LEVELS) + 1
+        lookup = np.asarray(SEVERITY_ID_CODES, dtype=np.intp)
+        severity = lookup[np.asarray(severity_ids, dtype=np.intp)]
+        for i in np.flatnonzero(severity < 0).tolist():
+            severity[i] = self.severity_code(failed_rows[i])
+        
+        category = np.repeat(np.arange(len(category_sizes), dtype=np.intp), category_sizes)
+        grid = np.bincount(category * width + severity,
+                           minlength=len(category_sizes) * width).reshape(len(category_sizes), width)
+        
+        group_grids = {}
+        categories = len(category_sizes)
+        for dim, (size, failed_codes, passed_codes) in group_codes.items():
+            failed_codes = np.asarray(failed_codes, dtype=np.intp)
+            group_grids[dim] = (
+                np.bincount(np.asarray(passed_codes, dtype=np.intp), minlength=size).tolist(),
+                np.bincount(failed_codes * width + severity, minlength=size * width).reshape(size, width).tolist(),
+                np.bincount(failed_codes * categories + category,
+                            minlength=size * categories).reshape(size, categories).tolist()
+            )
+        return grid.tolist(), group_grids
+    
+    def _tally_python(self, np, failed_rows, severity_ids, category_sizes, group_codes):
+        width = len(SEVERITY_LEVELS) + 1
+        severity = [SEVERITY_ID_CODES[severity_id] for severity_id in severity_ids]
+        for i, code in enumerate(severity):
+            if code < 0:
+                severity[i] = self.severity_code(failed_rows[i])
+        
+        category = [code for code, size in enumerate(category_sizes) for _ in range(size)]
+        grid = [[0] * width for _ in category_sizes]
+        for code, level in zip(category, severity):
+            grid[code][level] += 1
+        
+        group_grids = {}
+        for dim, (size, failed_codes, passed_codes) in group_codes.items():
+            passed_counts = [0] * size
+            for row in passed_codes:
+                passed_counts[row] += 1
+            severity_grid = [[0] * width for _ in range(size)]
+            category_grid = [[0] * len(category_sizes) for _ in range(size)]
+            for row, code, level in zip(failed_codes, category, severity):
+                severity_grid[row][level] += 1
+                category_grid[row][code] += 1
+            group_grids[dim] = (passed_counts, severity_grid, category_grid)
+        return grid, group_grids
+    
     def generate_executive_summary(self, findings):
         """Create executive summary for banking leadership"""
         if not findings:
             print("No findings to process")
             return None
             
-        risk_score = self.calculate_risk_score(findings)
         categories = self.categorize_banking_findings(findings)
+        groups = GroupAggregates(SEVERITY_LEVELS, categories) if self.drilldown else None
+        hotspots = HotspotIndex(self.hotspot_capacity, self.top_n)
+        counts = self.tally_findings(findings, categories, groups, hotspots)
+        risk_score = self.score_from_counts(counts['passed'], counts['failed'])
+        severity = counts['severity']
         
-        # Count findings by severity
-        critical_count = 0
-        high_count = 0
-        medium_count = 0
-        low_count = 0
-        failed_count = 0
+        controls = ControlIndex(self.frameworks)
         
         for finding in findings:
-            if not isinstance(finding, dict):
-                continue
-                
-            if finding.get('status_code') == 2:  # Failed
-                failed_count += 1
-                severity = self.get_severity_from_ocsf(finding)
-                
-                if severity == 'critical':
-                    critical_count += 1
-                elif severity == 'high':
-                    high_count += 1
-                elif severity == 'medium':
-                    medium_count += 1
-                elif severity == 'low':
-                    low_count += 1
+            if isinstance(finding, dict):
+                controls.add(finding)
         
         summary = {
             'scan_date': datetime.now().isoformat(),
             'overall_risk_score': risk_score,
             'compliance_grade': self.get_compliance_grade(risk_score),
             'total_checks': len(findings),
-            'passed_checks': len([f for f in findings if isinstance(f, dict) and f.get('status_code') == 1]),
-            'failed_checks': failed_count,
-            'critical_findings': critical_count,
-            'high_findings': high_count,
-            'medium_findings': medium_count,
-            'low_findings': low_count,
-            'categories': {}
+            'passed_checks': counts['passed'],
+            'failed_checks': counts['failed'],
+            'critical_findings': severity['critical'],
+            'high_findings': severity['high'],
+            'medium_findings': severity['medium'],
+            'low_findings': severity['low'],
+            'weighted_severity_score': severity['weighted'],
+            'categories': {},
+            'top_offenders': hotspots.to_dict(),
+            'frameworks': controls.to_dict()
         }
         
         for category, items in categories.items():
             summary['categories'][category] = {
                 'count': len(items),
-                'priority': 'HIGH' if len(items) > 5 else 'MEDIUM' if len(items) > 2 else 'LOW'
+                'priority': 'HIGH' if len(items) > 5 else 'MEDIUM' if len(items) > 2 else 'LOW',
+                'severity': counts['categories'][category]
             }
         
         # Add banking-specific recommendations
         summary['recommendations'] = self.get_banking_recommendations(categories, risk_score)
         
+        if groups is not None:
+            summary['drilldown'] = groups.to_dict(self.score_from_counts, self.get_compliance_grade,
+                                                  self.severity_weights)
+        
         return summary
     
     def get_compliance_grade(self, score):
@@ -290,6 +459,96 @@ class ComplianceSummaryGenerator:
         
         return recommendations
     
+    def render_markdown(self, summary, drilldown=None):
+        """Render the Markdown report in memory"""
+        parts = []
+        w = parts.append
+        
+        w(f"# Banking Compliance Executive Summary\n\n")
+        w(f"**Date:** {summary['scan_date']}\n\n")
+        w(f"## Overall Compliance Score: {summary['overall_risk_score']}%\n")
+        w(f"**Grade:** {summary['compliance_grade']}\n\n")
+        
+        w(f"## Key Metrics\n")
+        w(f"- Total Checks Run: {summary['total_checks']}\n")
+        w(f"- Passed Checks: {summary['passed_checks']}\n")
+        w(f"- Failed Checks: {summary['failed_checks']}\n")
+        w(f"- Critical Issues: {summary['critical_findings']}\n")
+        w(f"- High Priority Issues: {summary['high_findings']}\n")
+        w(f"- Medium Priority Issues: {summary['medium_findings']}\n")
+        w(f"- Low Priority Issues: {summary['low_findings']}\n\n")
+        
+        w(f"## Category Breakdown\n")
+        for cat, data in summary['categories'].items():
+            if data['count'] > 0:
+                w(f"- **{cat}:** {data['count']} issues ({data['priority']} priority)\n")
+        
+        offenders = summary.get('top_offenders', {})
+        if any(offenders.values()):
+            w(f"\n## Top Offenders\n")
+            for dim, label in (('checks', 'Failing Checks'), ('resources', 'Resources'),
+                               ('accounts', 'Accounts'), ('regions', 'Regions')):
+                entries = offenders.get(dim, [])
+                if entries:
+                    w(f"\n### {label}\n")
+                    for entry in entries:
+                        w(f"- `{entry['key']}`: {entry['failures']} failures\n")
+        
+        frameworks = summary.get('frameworks', {})
+        if frameworks:
+            w(f"\n## Framework Control Scores\n")
+            for framework, matrix in frameworks.items():
+                w(f"- **{framework}:** {matrix['passed_controls']}/{matrix['total_controls']} controls passed "
+                  f"({matrix['control_score']}%)\n")
+            
+            # Prowler maps each check to many frameworks; full control tables
+            # are only rendered for the requested (or banking) frameworks, the
+            # JSON keeps every matrix
+            prefixes = [f.lower() for f in self.frameworks] if self.frameworks else MARKDOWN_FRAMEWORKS
+            for framework, matrix in frameworks.items():
+                if not framework.lower().startswith(tuple(prefixes)):
+                    continue
+                w(f"\n### {framework} Controls\n\n")
+                w("| Control | Passed | Failed | Status |\n")
+                w("|---------|--------|--------|--------|\n")
+                for control, counts in matrix['controls'].items():
+                    w(f"| {control} | {counts['passed']} | {counts['failed']} | {counts['status']} |\n")
+        
+        if drilldown:
+            w(f"\n## Account & Region Breakdown\n")
+            for dim, label in (('accounts', 'Accounts'), ('regions', 'Regions')):
+                groups = drilldown.get(dim, {})
+                if not groups:
+                    continue
+                # Lowest scores first; the full set is in the drill-down shards
+                ranked = sorted(groups.items(), key=lambda item: (item[1]['overall_risk_score'], item[0]))
+                w(f"\n### {label} ({len(groups)})\n\n")
+                w("| " + label[:-1] + " | Score | Grade | Failed | Critical | High |\n")
+                w("|---|---|---|---|---|---|\n")
+                for key, group in ranked[:self.top_n]:
+                    w(f"| {key} | {group['overall_risk_score']}% | {group['compliance_grade'].split(' ')[0]} | "
+                      f"{group['failed_checks']} | {group['severity']['critical']} | {group['severity']['high']} |\n")
+        
+        if summary['recommendations']:
+            w(f"\n## Priority Recommendations\n")
+            for rec in summary['recommendations']:
+                w(f"\n### {rec['priority']} Priority\n")
+                w(f"- **Action:** {rec['action']}\n")
+                w(f"- **Timeline:** {rec['timeline']}\n")
+        
+        w(f"\n## Compliance Status\n")
+        w(f"This environment currently has a **{summary['overall_risk_score']}% compliance score**, ")
+        w(f"which indicates **{summary['compliance_grade']}**.\n\n")
+        
+        if summary['overall_risk_score'] < 50:
+            w("⚠️ **URGENT**: This environment requires immediate attention to meet banking compliance standards.\n")
+        elif summary['overall_risk_score'] < 80:
+            w("⚠️ **WARNING**: Significant compliance gaps exist that could result in regulatory findings.\n")
+        else:
+            w("✅ **GOOD**: Environment meets basic compliance requirements with room for improvement.\n")
+        
+        return ''.join(parts)
+    
     def save_summary(self, summary):
         """Save summary in multiple formats"""
         if not summary:
@@ -298,59 +557,157 @@ class ComplianceSummaryGenerator:
             
         output_base = self.reports_dir / f"executive_summary_{self.timestamp}"
         
-        # Save JSON
-        with open(f"{output_base}.json", 'w') as f:
-            json.dump(summary, f, indent=2)
+        documents = []
+        drilldown = summary.get('drilldown')
+        if drilldown:
+            # Groups go to their own shards; the main summary only links the index
+            drilldown_dir = self.reports_dir / f"drilldown_{self.timestamp}"
+            for path, payload in shard_documents(drilldown, drilldown_dir, self.timestamp):
+                documents.append((path, render_json(payload, self.compact_json)))
+            summary = dict(summary, drilldown={
+                'index': f"{drilldown_dir.name}/index.json",
+                **{dim: len(drilldown.get(dim, {})) for dim in DIMENSIONS}
+            })
         
-        # Save markdown for easy reading
-        with open(f"{output_base}.md", 'w') as f:
-            f.write(f"# Banking Compliance Executive Summary\n\n")
-            f.write(f"**Date:** {summary['scan_date']}\n\n")
-            f.write(f"## Overall Compliance Score: {summary['overall_risk_score']}%\n")
-            f.write(f"**Grade:** {summary['compliance_grade']}\n\n")
-            
-            f.write(f"## Key Metrics\n")
-            f.write(f"- Total Checks Run: {summary['total_checks']}\n")
-            f.write(f"- Passed Checks: {summary['passed_checks']}\n")
-            f.write(f"- Failed Checks: {summary['failed_checks']}\n")
-            f.write(f"- Critical Issues: {summary['critical_findings']}\n")
-            f.write(f"- High Priority Issues: {summary['high_findings']}\n")
-            f.write(f"- Medium Priority Issues: {summary['medium_findings']}\n")
-            f.write(f"- Low Priority Issues: {summary['low_findings']}\n\n")
-            
-            f.write(f"## Category Breakdown\n")
-            for cat, data in summary['categories'].items():
-                if data['count'] > 0:
-                    f.write(f"- **{cat}:** {data['count']} issues ({data['priority']} priority)\n")
-            
-            if summary['recommendations']:
-                f.write(f"\n## Priority Recommendations\n")
-                for rec in summary['recommendations']:
-                    f.write(f"\n### {rec['priority']} Priority\n")
-                    f.write(f"- **Action:** {rec['action']}\n")
-                    f.write(f"- **Timeline:** {rec['timeline']}\n")
-            
-            f.write(f"\n## Compliance Status\n")
-            f.write(f"This environment currently has a **{summary['overall_risk_score']}% compliance score**, ")
-            f.write(f"which indicates **{summary['compliance_grade']}**.\n\n")
-            
-            if summary['overall_risk_score'] < 50:
-                f.write("⚠️ **URGENT**: This environment requires immediate attention to meet banking compliance standards.\n")
-            elif summary['overall_risk_score'] < 80:
-                f.write("⚠️ **WARNING**: Significant compliance gaps exist that could result in regulatory findings.\n")
-            else:
-                f.write("✅ **GOOD**: Environment meets basic compliance requirements with room for improvement.\n")
+        # Render every document in memory, then write each atomically
+        documents.append((f"{output_base}.json", render_json(summary, self.compact_json)))
+        documents.append((f"{output_base}.md", self.render_markdown(summary, drilldown)))
+        write_documents(documents, self.write_workers)
         
         print(f"\n✅ Executive summary saved:")
         print(f"  - JSON: {output_base}.json")
         print(f"  - Markdown: {output_base}.md")
+        if drilldown:
+            print(f"  - Drill-down: {drilldown_dir}/index.json")
 
-def main():
+def summarize_report(reports_dir, json_file, label, **options):
+    """Summarize a single OCSF report as executive_summary_<label>"""
+    return summarize_inputs(reports_dir, [json_file], label, **options)
+
+def summarize_inputs(reports_dir, json_files, label, **options):
+    """Summarize the findings of several OCSF reports together as executive_summary_<label>"""
+    generator = ComplianceSummaryGenerator(reports_dir, label, **options)
+    findings = []
+    for json_file in json_files:
+        print(f"Processing: {json_file}")
+        findings.extend(generator.parse_prowler_ocsf_json(json_file))
+    if not findings:
+        print(f"No findings in {', '.join(str(f) for f in json_files)}")
+        return None
+    
+    print(f"Found {len(findings)} checks")
+    summary = generator.generate_executive_summary(findings)
+    generator.save_summary(summary)
+    return summary
+
+def summarize_first(reports_dir, json_files, label, **options):
+    """Summarize the first report with findings; return a batch index entry"""
+    for json_file in json_files:
+        summary = summarize_report(reports_dir, json_file, label, **options)
+        if summary:
+            return {
+                'label': label,
+                'source': str(json_file),
+                'summary': f"executive_summary_{label}.json",
+                'overall_risk_score': summary['overall_risk_score'],
+                'compliance_grade': summary['compliance_grade'],
+                'passed_checks': summary['passed_checks'],
+                'failed_checks': summary['failed_checks']
+            }
+    return {'label': label, 'source': [str(f) for f in json_files], 'error': 'no findings'}
+
+def resolve_batch(reports_dir, items):
+    """Expand batch items (timestamps, files or globs) into (label, [files]) units"""
+    units = []
+    seen = set()
+    for item in items:
+        if any(ch in item for ch in '*?['):
+            matches = sorted(glob.glob(item)) or sorted(glob.glob(str(Path(reports_dir) / item)))
+            matches = [Path(match) for match in matches]
+            found = [(report_label(path), [path]) for path in matches if path.name.endswith(OCSF_SUFFIX)]
+        elif Path(item).is_file():
+            found = [(report_label(item), [Path(item)])]
+        else:
+            # A scan timestamp, summarized exactly like --timestamp
+            files = sorted(Path(reports_dir).glob(f"*{item}*{OCSF_SUFFIX}"))
+            found = [(item, files)] if files else []
+        
+        if not found:
+            print(f"No OCSF JSON reports found for: {item}")
+        for label, files in found:
+            if label not in seen:
+                seen.add(label)
+                units.append((label, files))
+    return units
+
+def run_batch(reports_dir, items, workers=None, **options):
+    """Summarize many scans in one process pool and write a batch index"""
+    units = resolve_batch(reports_dir, items)
+    if not units:
+        return None
+    
+    # Worker processes are reused across scans, so each worker imports the
+    # module and compiles the category patterns only once
+    from concurrent.futures import ProcessPoolExecutor
+    
+    entries = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(summarize_first, reports_dir, files, label, **options)
+                   for label, files in units]
+        for (label, _), future in zip(units, futures):
+            try:
+                entries.append(future.result())
+            except Exception as e:
+                entries.append({'label': label, 'error': str(e)})
+    
+    index = {
+        'generated': datetime.now().isoformat(),
+        'scans': len(entries),
+        'failed': sum(1 for entry in entries if 'error' in entry),
+        'summaries': entries
+    }
+    index_file = Path(reports_dir) / f"summary_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    write_atomic(index_file, render_json(index))
+    
+    print(f"\n✅ Batch of {len(entries)} summaries complete ({index['failed']} failed)")
+    print(f"  - Index: {index_file}")
+    return index
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Generate banking compliance summary')
     parser.add_argument('--reports-dir', required=True, help='Directory containing Prowler reports')
-    parser.add_argument('--timestamp', required=True, help='Timestamp for this scan')
+    parser.add_argument('--timestamp', help='Timestamp for this scan')
+    parser.add_argument('--batch', nargs='+', default=None, metavar='ITEM',
+                        help='Summarize many scans at once: timestamps, OCSF files or globs')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for --batch')
+    parser.add_argument('--top', type=int, default=10, help='Number of top offenders to report per dimension')
+    parser.add_argument('--hotspot-capacity', type=int, default=1000,
+                        help='Maximum keys tracked per offender dimension (bounds memory)')
+    parser.add_argument('--input', nargs='+', default=None,
+                        help='Summarize these OCSF/NDJSON files together as one summary (e.g. '
+                             'merge_findings.py output) instead of looking them up by timestamp')
+    parser.add_argument('--no-drilldown', action='store_true',
+                        help='Skip the per-account and per-region drill-down shards')
+    parser.add_argument('--compact-json', action='store_true', help='Write summary JSON without indentation')
+    parser.add_argument('--no-numpy', action='store_true', help='Disable the NumPy counting fast path')
+    parser.add_argument('--frameworks', nargs='*', default=None,
+                        help='Limit control matrices to these frameworks (e.g. FFIEC PCI SOC2); default: all, '
+                             'with Markdown control tables for FFIEC, PCI, SOC2 and CIS only')
+    
+    args = parser.parse_args(argv)
+    options = dict(top_n=args.top, hotspot_capacity=args.hotspot_capacity,
+                   frameworks=args.frameworks, use_numpy=not args.no_numpy,
+                   compact_json=args.compact_json, drilldown=not args.no_drilldown)
     
-    args = parser.parse_args()
+    if args.batch:
+        run_batch(args.reports_dir, args.batch, args.workers, **options)
+        return
+    if not args.timestamp:
+        parser.error('--timestamp is required unless --batch is given')
+    
+    if args.input:
+        summarize_inputs(args.reports_dir, [Path(p) for p in args.input], args.timestamp, **options)
+        return
     
     # Find the latest OCSF JSON report
     reports_dir = Path(args.reports_dir)
@@ -361,19 +718,11 @@ def main():
         print(f"Looking in: {reports_dir}")
         return
     
-    # Process the report
-    generator = ComplianceSummaryGenerator(args.reports_dir, args.timestamp)
-    
+    # Process the first report that has findings
     for json_file in json_files:
-        print(f"Processing: {json_file}")
-        findings = generator.parse_prowler_ocsf_json(json_file)
-        if findings:
-            print(f"Found {len(findings)} checks")
-            summary = generator.generate_executive_summary(findings)
-            generator.save_summary(summary)
+        summary = summarize_report(args.reports_dir, json_file, args.timestamp, **options)
+        if summary:
             break
-        else:
-            print(f"No findings in {json_file}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Top-N offender tracking for banking compliance summaries
+Keeps bounded counters for the checks, resources, accounts and regions
+that cause the most failures, no matter how many findings are processed
+"""
+
+import heapq
+
+from drilldown import finding_groups
+from merge_findings import finding_key
+
+
+class TopOffenders:
+    """Approximate top-N counter using the Space-Saving algorithm
+
+    At most `capacity` keys are tracked. When a new key arrives and the
+    table is full, the key with the smallest count is evicted and the new
+    key inherits that count (recorded as `error`), so heavy hitters are
+    never undercounted.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = max(1, int(capacity))
+        self.counts = {}
+        self.errors = {}
+        self._heap = []
+
+    def add(self, key, count=1):
+        if not key:
+            return
+
+        if key in self.counts:
+            self.counts[key] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = count
+            self.errors[key] = 0
+        else:
+            floor_key, floor_count = self._pop_min()
+            del self.counts[floor_key]
+            del self.errors[floor_key]
+            self.counts[key] = floor_count + count
+            self.errors[key] = floor_count
+
+        heapq.heappush(self._heap, (self.counts[key], key))
+
+        # Stale heap entries pile up on every increment; rebuild from the
+        # live table once the heap gets too far ahead of it
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, k) for k, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self):
+        while self._heap:
+            count, key = heapq.heappop(self._heap)
+            if self.counts.get(key) == count:
+                return key, count
+        # Heap drained of live entries, fall back to a scan
+        key = min(self.counts, key=self.counts.get)
+        return key, self.counts[key]
+
+    def top(self, n=10):
+        """Return the n heaviest keys as a list of dicts; ties are listed by key"""
+        ranked = heapq.nsmallest(n, self.counts.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            {'key': key, 'failures': count, 'error': self.errors[key]}
+            for key, count in ranked
+        ]
+
+
+class HotspotIndex:
+    """Bundle of top-N counters fed from failed OCSF findings"""
+
+    DIMENSIONS = ('checks', 'resources', 'accounts', 'regions')
+
+    def __init__(self, capacity=1000, top_n=10):
+        self.top_n = top_n
+        self.counters = {dim: TopOffenders(capacity) for dim in self.DIMENSIONS}
+
+    def add(self, finding, key=None, groups=None):
+        """Record a failed finding against every dimension
+
+        key and groups are its finding_key and finding_groups if already known.
+        """
+        key = key or finding_key(finding)
+        account, region = groups or finding_groups(finding, key)
+
+        self.counters['checks'].add(key[0])
+        self.counters['resources'].add(key[1])
+        self.counters['accounts'].add(account)
+        self.counters['regions'].add(region)
+
+    def to_dict(self):
+        return {dim: counter.top(self.top_n) for dim, counter in self.counters.items()}
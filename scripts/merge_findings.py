@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Merge and deduplicate Prowler OCSF findings across shards and reruns
+Uses an external merge sort so memory stays within a fixed budget, and
+keeps only the newest finding for each (check, resource, region)
+"""
+
+import argparse
+import glob
+import heapq
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Maximum spill files merged at once; more runs are merged in several passes
+MAX_FAN_IN = 64
+
+
+def finding_key(finding):
+    """(check, resource, region) identity of an OCSF finding"""
+    metadata = finding.get('metadata') or {}
+    cloud = finding.get('cloud') or {}
+    resources = finding.get('resources') or []
+    resource = resources[0] if resources else {}
+    region = cloud.get('region') or resource.get('region', '')
+    return (metadata.get('event_code', ''), resource.get('uid', ''), region)
+
+
+def iter_ocsf(report):
+    """Yield findings from an NDJSON OCSF report, skipping unparseable lines"""
+    with open(report, 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                finding = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(finding, dict):
+                yield finding
+
+
+def finding_time(finding):
+    """Finding time as epoch seconds (0 if unknown)"""
+    value = finding.get('time')
+    if isinstance(value, (int, float)):
+        # OCSF timestamps are epoch milliseconds; Prowler has emitted seconds
+        return value / 1000 if value > 1e11 else value
+    value = finding.get('time_dt')
+    if value:
+        try:
+            return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            pass
+    return 0
+
+
+class FindingMerger:
+    """External sort of findings by key, newest first within each key
+
+    Findings are buffered until `memory_budget` bytes of raw JSON are held,
+    then sorted and spilled to a temporary run file. Runs are k-way merged
+    and only the first (newest) finding of each key is emitted.
+    """
+
+    def __init__(self, memory_budget=256 * 1024 * 1024, temp_dir=None):
+        self.memory_budget = memory_budget
+        self.temp_dir = tempfile.mkdtemp(prefix='merge_findings_', dir=temp_dir)
+        self.runs = []
+        self.buffer = []
+        self.buffered_bytes = 0
+        self.sequence = 0
+        self.read = 0
+
+    def _sort_key(self, finding):
+        check, resource, region = finding_key(finding)
+        self.sequence += 1
+        if not check:
+            # Findings without a check ID cannot be matched, keep every one
+            resource, region = '', str(self.sequence)
+        # Later inputs win ties on time, so reruns replace earlier shards
+        return [check, resource, region, -finding_time(finding), -self.sequence]
+
+    def add_report(self, report):
+        for finding in iter_ocsf(report):
+            line = json.dumps(finding, separators=(',', ':'))
+            self.buffer.append((self._sort_key(finding), line))
+            self.buffered_bytes += len(line) + 64
+            self.read += 1
+            if self.buffered_bytes >= self.memory_budget:
+                self._spill()
+
+    def _write_run(self, records):
+        fd, path = tempfile.mkstemp(suffix='.run', dir=self.temp_dir)
+        with os.fdopen(fd, 'w') as f:
+            for sort_key, line in records:
+                f.write(json.dumps(sort_key))
+                f.write('\t')
+                f.write(line)
+                f.write('\n')
+        return path
+
+    def _spill(self):
+        if not self.buffer:
+            return
+        self.buffer.sort(key=lambda record: record[0])
+        self.runs.append(self._write_run(self.buffer))
+        self.buffer = []
+        self.buffered_bytes = 0
+
+    @staticmethod
+    def _read_run(path):
+        with open(path, 'r') as f:
+            for row in f:
+                sort_key, line = row.rstrip('\n').split('\t', 1)
+                yield json.loads(sort_key), line
+
+    def _merge_runs(self, paths):
+        return heapq.merge(*(self._read_run(path) for path in paths), key=lambda record: record[0])
+
+    def _reduce_runs(self):
+        """Merge runs in passes until at most MAX_FAN_IN remain"""
+        while len(self.runs) > MAX_FAN_IN:
+            merged = []
+            for start in range(0, len(self.runs), MAX_FAN_IN):
+                group = self.runs[start:start + MAX_FAN_IN]
+                merged.append(self._write_run(self._merge_runs(group)))
+                for path in group:
+                    os.remove(path)
+            self.runs = merged
+
+    def records(self):
+        """Yield deduplicated raw JSON lines ordered by (check, resource, region)"""
+        if self.runs:
+            self._spill()
+            self._reduce_runs()
+            stream = self._merge_runs(self.runs)
+        else:
+            # Everything fit in the budget, no need to touch disk
+            self.buffer.sort(key=lambda record: record[0])
+            stream = iter(self.buffer)
+
+        previous = None
+        for sort_key, line in stream:
+            key = sort_key[:3]
+            if key == previous:
+                continue
+            previous = key
+            yield line
+
+    def write(self, out):
+        written = 0
+        for line in self.records():
+            out.write(line)
+            out.write('\n')
+            written += 1
+        return written
+
+    def cleanup(self):
+        for path in self.runs:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.runs = []
+        try:
+            os.rmdir(self.temp_dir)
+        except OSError:
+            pass
+
+
+def expand_inputs(patterns):
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or ([pattern] if Path(pattern).is_file() else [])
+        if not matches:
+            print(f"No reports match: {pattern}", file=sys.stderr)
+        files.extend(matches)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge and deduplicate OCSF findings within a memory budget')
+    parser.add_argument('inputs', nargs='+', help='OCSF reports or globs, oldest first (later inputs win ties)')
+    parser.add_argument('--output', '-o', default='-', help='Output NDJSON file (default: stdout)')
+    parser.add_argument('--memory-mb', type=float, default=256, help='Memory budget for buffered findings')
+    parser.add_argument('--temp-dir', default=None, help='Directory for spill files')
+
+    args = parser.parse_args()
+
+    reports = expand_inputs(args.inputs)
+    if not reports:
+        sys.exit(1)
+
+    merger = FindingMerger(int(args.memory_mb * 1024 * 1024), args.temp_dir)
+    try:
+        for report in reports:
+            print(f"Reading {report}...", file=sys.stderr)
+            merger.add_report(report)
+
+        if args.output == '-':
+            written = merger.write(sys.stdout)
+        else:
+            tmp = f"{args.output}.tmp"
+            with open(tmp, 'w') as out:
+                written = merger.write(out)
+            os.replace(tmp, args.output)
+    finally:
+        merger.cleanup()
+
+    print(f"Merged {merger.read} findings into {written} unique findings "
+          f"({len(reports)} reports)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Atomic report writing for banking compliance outputs
+Documents are rendered in memory and written with a single write to a temp
+file that is renamed into place, so watchers never read a partial report
+"""
+
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+
+def render_json(data, compact=False):
+    """Serialize a report; compact drops indentation and spacing"""
+    if compact:
+        return json.dumps(data, separators=(',', ':'))
+    return json.dumps(data, indent=2)
+
+
+def current_umask():
+    """Process umask (reading it requires setting it, so restore immediately)"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask is process-wide, so probing it from the
+# writer threads could briefly clear it for files created meanwhile
+DEFAULT_MODE = 0o666 & ~current_umask()
+
+
+def write_atomic(path, content):
+    """Write text to path via a hidden temp file in the same directory and rename
+
+    mkstemp creates the temp file as 0600; it gets the mode of the file it
+    replaces, or the umask default a plain open() would give, before the rename.
+    """
+    path = Path(path)
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = DEFAULT_MODE
+    # Leading dot and .tmp suffix keep the temp file out of report globs
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            os.fchmod(f.fileno(), mode)
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return path
+
+
+def write_documents(documents, workers=8):
+    """Write many (path, content) documents concurrently on a thread pool"""
+    documents = list(documents)
+    if len(documents) <= 1 or workers <= 1:
+        return [write_atomic(path, content) for path, content in documents]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(documents))) as pool:
+        return list(pool.map(lambda doc: write_atomic(*doc), documents))
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Scan checkpointing for resumable banking compliance scans
+Records which scan units (check selection x account x region) have finished
+so an interrupted run can be resumed into the same report set
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from merge_findings import iter_ocsf
+
+PENDING = 'pending'
+RUNNING = 'running'
+COMPLETE = 'complete'
+FAILED = 'failed'
+
+
+def manifest_path(reports_dir, timestamp):
+    return Path(reports_dir) / f"scan_manifest_{timestamp}.json"
+
+
+def finding_check(finding):
+    return (finding.get('metadata') or {}).get('event_code')
+
+
+def completed_checks(report):
+    """Check IDs that have findings in a finished OCSF report"""
+    checks = set()
+    try:
+        for finding in iter_ocsf(report):
+            check_id = finding_check(finding)
+            if check_id:
+                checks.add(check_id)
+    except FileNotFoundError:
+        pass
+    return checks
+
+
+def line_check(line):
+    """Check ID of one NDJSON line (None if it is not a finding)"""
+    try:
+        finding = json.loads(line) if line.strip() else None
+    except json.JSONDecodeError:
+        return None
+    return finding_check(finding) if isinstance(finding, dict) else None
+
+
+def resume_point(report):
+    """(finished check IDs, byte offset to keep, stale check) for a partial OCSF report
+
+    Prowler writes each check's findings together, so the check in the last
+    complete line may have been cut off part-way through its resources. It
+    is left out of the finished set so the resumed run scans it again, and
+    the offset marks where its trailing run of findings begins so
+    append_report can drop them instead of counting them twice. If that
+    check also has findings earlier in the report (interleaved with other
+    checks) it is returned as the stale check, whose findings append_report
+    filters out as well.
+    """
+    checks = set()
+    last_check = None
+    keep = 0
+    try:
+        with open(report, 'rb') as f:
+            offset = 0
+            for line in f:
+                start = offset
+                offset += len(line)
+                if not line.endswith(b'\n'):
+                    # Truncated final line from a killed scan
+                    break
+                check_id = line_check(line)
+                if check_id and check_id != last_check:
+                    if last_check:
+                        checks.add(last_check)
+                    last_check = check_id
+                    keep = start
+                elif last_check is None:
+                    keep = offset
+    except FileNotFoundError:
+        pass
+    stale_check = last_check if last_check in checks else None
+    checks.discard(last_check)
+    return checks, keep, stale_check
+
+
+def append_report(part, report, keep=None, stale_check=None):
+    """Append a resumed run's NDJSON findings onto the original report
+
+    keep and stale_check come from resume_point; anything after keep (the
+    interrupted check and any truncated line) is dropped first, and so is
+    every earlier finding of stale_check, since the resumed run rescanned it.
+    """
+    part = Path(part)
+    report = Path(report)
+
+    if stale_check:
+        # Rewrite the kept part without the stale check's findings
+        tmp = report.with_name(f".{report.name}.tmp")
+        with open(report, 'rb') as src, open(tmp, 'wb') as out:
+            offset = 0
+            for line in src:
+                offset += len(line)
+                if offset > keep:
+                    break
+                if line_check(line) != stale_check:
+                    out.write(line)
+            with open(part, 'rb') as resumed:
+                shutil.copyfileobj(resumed, out, 1024 * 1024)
+        shutil.copymode(report, tmp)
+        os.replace(tmp, report)
+        part.unlink()
+        return
+
+    with open(report, 'ab+') as out:
+        out.seek(0, os.SEEK_END)
+        size = out.tell()
+        if keep is not None:
+            out.truncate(min(keep, size))
+        elif size:
+            # Drop a truncated trailing line left by the interrupted scan
+            out.seek(max(0, size - 65536))
+            tail = out.read()
+            if not tail.endswith(b'\n'):
+                cut = tail.rfind(b'\n')
+                out.truncate(size - len(tail) + cut + 1 if cut >= 0 else size - len(tail))
+
+        with open(part, 'rb') as src:
+            shutil.copyfileobj(src, out, 1024 * 1024)
+
+    part.unlink()
+
+
+class CheckpointManifest:
+    """JSON manifest of scan units for one TIMESTAMP, rewritten atomically"""
+
+    def __init__(self, path, data):
+        self.path = Path(path)
+        self.data = data
+
+    @classmethod
+    def create(cls, reports_dir, timestamp, framework, profiles=None, regions=None, account=None, baseline=None):
+        data = {
+            'timestamp': timestamp,
+            'framework': framework,
+            'profiles': profiles,
+            'regions': regions,
+            'account': account,
+            'baseline': baseline,
+            'created': datetime.now().isoformat(),
+            'units': {}
+        }
+        manifest = cls(manifest_path(reports_dir, timestamp), data)
+        manifest.save()
+        return manifest
+
+    @classmethod
+    def load(cls, reports_dir, timestamp):
+        path = manifest_path(reports_dir, timestamp)
+        with open(path, 'r') as f:
+            return cls(path, json.load(f))
+
+    def save(self):
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def status(self, unit):
+        return self.data['units'].get(unit, {}).get('status', PENDING)
+
+    def mark(self, unit, status, report=None, checks=None):
+        entry = self.data['units'].setdefault(unit, {'attempts': 0})
+        entry['status'] = status
+        entry['updated'] = datetime.now().isoformat()
+        if status == RUNNING:
+            entry['attempts'] += 1
+        if report is not None:
+            entry['report'] = str(report)
+        if checks is not None:
+            entry['completed_checks'] = sorted(checks)
+        self.save()
+
+    def incomplete(self):
+        return [unit for unit, entry in self.data['units'].items() if entry.get('status') != COMPLETE]
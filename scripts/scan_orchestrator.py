@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Banking Compliance Scan Orchestrator
+Runs Prowler compliance scans as concurrent asyncio subprocesses, streams
+their output, and summarizes each report as soon as its scan finishes
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import signal
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from generate_summary import summarize_report
+from scan_checkpoint import (COMPLETE, FAILED, RUNNING, CheckpointManifest, append_report, completed_checks,
+                             resume_point)
+from verify_fixes import Baseline, build_delta, save_delta
+
+# Color codes for output
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+NC = '\033[0m'
+
+# Prowler exits with 3 when the scan ran but some checks failed
+PROWLER_OK_CODES = (0, 3)
+
+QUICK_TEST_CHECKS = ['iam_root_mfa_enabled', 'iam_password_policy_uppercase', 's3_bucket_public_access_block']
+
+# framework -> [(output prefix, prowler selection args, output formats)]
+FRAMEWORKS = {
+    'pci-dss': [('pci-dss', ['--compliance', 'pci_3.2.1_aws'], ['json-ocsf', 'html'])],
+    'sox': [('sox', ['--compliance', 'soc2_aws'], ['json-ocsf', 'html'])],
+    'cis': [('cis', ['--compliance', 'cis_2.0_aws'], ['json-ocsf', 'html'])],
+    'ffiec': [('ffiec', ['--compliance', 'ffiec_aws'], ['json-ocsf', 'html'])],
+    'quick-test': [('quick_test', ['--check'] + QUICK_TEST_CHECKS, ['json-ocsf', 'html'])],
+    'all-banking': [
+        ('banking_pci', ['--compliance', 'pci_3.2.1_aws'], ['json-ocsf']),
+        ('banking_soc2', ['--compliance', 'soc2_aws'], ['json-ocsf']),
+        ('banking_comprehensive', ['--compliance', 'ffiec_aws'], ['json-ocsf', 'html']),
+    ],
+}
+
+# Rescans only the previous run's failing checks; selection comes from the baseline
+VERIFY_FIXES = 'verify-fixes'
+
+
+class ScanJob:
+    """A single Prowler invocation and the report it produces"""
+
+    def __init__(self, prefix, selection, formats, timestamp, profile=None, region=None):
+        self.selection = selection
+        self.formats = formats
+        self.profile = profile
+        self.region = region
+
+        parts = [prefix]
+        if profile:
+            parts.append(profile)
+        if region:
+            parts.append(region)
+        parts.append(timestamp)
+        self.output_name = '_'.join(parts)
+
+    @property
+    def name(self):
+        return self.output_name
+
+    def command(self, prowler_cmd, reports_dir, excluded_checks=None):
+        cmd = [prowler_cmd, 'aws'] + self.selection
+        if excluded_checks:
+            cmd += ['--excluded-check'] + sorted(excluded_checks)
+        if self.profile:
+            cmd += ['--profile', self.profile]
+        if self.region:
+            cmd += ['--region', self.region]
+        cmd += ['--output-formats'] + self.formats
+        cmd += ['--output-directory', str(reports_dir), '--output-filename', self.output_name]
+        return cmd
+
+    def report_path(self, reports_dir):
+        return Path(reports_dir) / f"{self.output_name}.ocsf.json"
+
+
+def build_jobs(framework, timestamp, profiles=None, regions=None, baseline=None):
+    """Expand a framework into jobs, sharded across profiles and regions"""
+    if framework == VERIFY_FIXES:
+        # Regions come from the baseline selection rather than shards
+        selection = baseline.prowler_selection()
+        return [ScanJob('verify_fixes', selection, ['json-ocsf'], timestamp, profile)
+                for profile in profiles or [None]]
+
+    jobs = []
+    for prefix, selection, formats in FRAMEWORKS[framework]:
+        for profile in profiles or [None]:
+            for region in regions or [None]:
+                jobs.append(ScanJob(prefix, selection, formats, timestamp, profile, region))
+    return jobs
+
+
+async def stream_output(stream, label):
+    """Relay a subprocess stream line by line, prefixed with its job"""
+    while True:
+        line = await stream.readline()
+        if not line:
+            break
+        text = line.decode('utf-8', errors='replace').rstrip()
+        if text:
+            print(f"[{label}] {text}", flush=True)
+
+
+async def terminate(process, grace=10):
+    """Stop a subprocess and its children, escalating from SIGTERM to SIGKILL"""
+    if process.returncode is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        await asyncio.wait_for(process.wait(), grace)
+    except ProcessLookupError:
+        return
+    except asyncio.TimeoutError:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            return
+        await process.wait()
+
+
+async def run_command(cmd, label, timeout=None, env=None):
+    """Run a command with streamed output; return its exit code (None on timeout)"""
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        limit=1024 * 1024,
+        start_new_session=True
+    )
+    streams = asyncio.gather(stream_output(process.stdout, label), stream_output(process.stderr, label))
+    try:
+        await asyncio.wait_for(process.wait(), timeout)
+    except asyncio.TimeoutError:
+        print(f"{RED}[!] {label} timed out after {timeout}s, stopping it{NC}")
+        await terminate(process)
+        return None
+    except asyncio.CancelledError:
+        await terminate(process)
+        raise
+    finally:
+        await streams
+    return process.returncode
+
+
+class ScanOrchestrator:
+    """Runs scan jobs concurrently and feeds finished reports to the summary stage"""
+
+    def __init__(self, reports_dir, timestamp, prowler_cmd='prowler', max_parallel=2,
+                 job_timeout=None, summary_workers=2, manifest=None, resume=False):
+        self.reports_dir = Path(reports_dir)
+        self.timestamp = timestamp
+        self.prowler_cmd = prowler_cmd
+        self.semaphore = asyncio.Semaphore(max_parallel)
+        self.job_timeout = job_timeout
+        self.summary_pool = ProcessPoolExecutor(max_workers=summary_workers)
+        self.manifest = manifest
+        self.resume = resume
+        self.account = None
+        self.results = {}
+
+    async def check_prerequisites(self):
+        """Verify Prowler, the AWS CLI and AWS credentials concurrently"""
+        print(f"{YELLOW}[*] Checking prerequisites...{NC}")
+
+        if not shutil.which('aws'):
+            print(f"{RED}[!] AWS CLI not found. Please install AWS CLI.{NC}")
+            print("Run: sudo apt install awscli")
+            return False
+
+        async def quiet(cmd):
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+            except OSError:
+                return 127
+            return await process.wait()
+
+        async def identity():
+            process = await asyncio.create_subprocess_exec(
+                'aws', 'sts', 'get-caller-identity', '--output', 'json',
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+            stdout, _ = await process.communicate()
+            if process.returncode != 0:
+                return None
+            try:
+                return json.loads(stdout).get('Account', '')
+            except json.JSONDecodeError:
+                return ''
+
+        prowler_rc, account = await asyncio.gather(
+            quiet([self.prowler_cmd, '--version']),
+            identity()
+        )
+        if prowler_rc != 0:
+            print(f"{RED}[!] Prowler not working. Please run setup.sh{NC}")
+            return False
+        if account is None:
+            print(f"{RED}[!] AWS credentials not configured.{NC}")
+            print("Run: aws configure")
+            return False
+        self.account = account
+
+        print(f"{GREEN}[✓] All prerequisites met{NC}")
+        return True
+
+    def summary_label(self, job, jobs):
+        # A lone report keeps the historical executive_summary_<timestamp> name
+        return self.timestamp if len(jobs) == 1 else job.output_name
+
+    async def summarize(self, job, label):
+        report = job.report_path(self.reports_dir)
+        if not report.exists():
+            print(f"{YELLOW}[!] No JSON report found for {job.name}, skipping summary generation{NC}")
+            return
+        print(f"{YELLOW}[*] Generating executive summary for {job.name}...{NC}")
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self.summary_pool, summarize_report,
+                                       str(self.reports_dir), str(report), label)
+            print(f"{GREEN}[✓] Summary generated for {job.name}{NC}")
+        except Exception as e:
+            print(f"{RED}[!] Summary failed for {job.name}: {e}{NC}")
+
+    def checkpoint(self, job, status, checks=None):
+        if self.manifest is not None:
+            self.manifest.mark(job.name, status, job.report_path(self.reports_dir), checks)
+
+    async def run_job(self, job, jobs):
+        report = job.report_path(self.reports_dir)
+        side_dir = None
+        excluded = None
+        keep = stale_check = None
+
+        if self.resume:
+            if self.manifest.status(job.name) == COMPLETE:
+                print(f"{GREEN}[✓] {job.name} already complete, skipping{NC}")
+                self.results[job.name] = True
+                return True
+            # Re-run only the checks missing from the partial report, into a
+            # hidden side directory so its HTML/CSV outputs do not pile up
+            excluded, keep, stale_check = resume_point(report)
+            if excluded:
+                side_dir = Path(tempfile.mkdtemp(prefix=f".resume_{job.output_name}_", dir=self.reports_dir))
+                print(f"{YELLOW}[*] Resuming {job.name}: {len(excluded)} checks already done{NC}")
+
+        try:
+            async with self.semaphore:
+                print(f"{YELLOW}[*] Running {job.name}...{NC}")
+                self.checkpoint(job, RUNNING)
+                started = datetime.now()
+                try:
+                    returncode = await run_command(job.command(self.prowler_cmd, side_dir or self.reports_dir, excluded),
+                                                   job.name, self.job_timeout)
+                except OSError as e:
+                    print(f"{RED}[!] {job.name} could not be started: {e}{NC}")
+                    self.results[job.name] = False
+                    self.checkpoint(job, FAILED)
+                    return False
+                elapsed = (datetime.now() - started).total_seconds()
+
+            ok = returncode in PROWLER_OK_CODES
+            part = job.report_path(side_dir) if side_dir else None
+            if part and part.exists():
+                # Merge whatever the resumed run produced into the original report set
+                try:
+                    append_report(part, report, keep, stale_check)
+                except OSError as e:
+                    print(f"{RED}[!] Could not merge resumed findings for {job.name}: {e}{NC}")
+                    ok = False
+        finally:
+            if side_dir:
+                shutil.rmtree(side_dir, ignore_errors=True)
+
+        self.results[job.name] = ok
+        checks = completed_checks(report) if ok else resume_point(report)[0]
+        self.checkpoint(job, COMPLETE if ok else FAILED, checks)
+        if ok:
+            print(f"{GREEN}[✓] {job.name} scan completed in {elapsed:.0f}s{NC}")
+            await self.summarize(job, self.summary_label(job, jobs))
+        else:
+            print(f"{RED}[!] {job.name} scan failed (exit code {returncode}){NC}")
+        return ok
+
+    async def run(self, jobs):
+        """Run all jobs; cancel outstanding work on SIGINT/SIGTERM"""
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        loop = asyncio.get_running_loop()
+        tasks = [asyncio.ensure_future(self.run_job(job, jobs)) for job in jobs]
+
+        def cancel_all():
+            print(f"\n{RED}[!] Cancelling {sum(not t.done() for t in tasks)} running job(s)...{NC}")
+            for task in tasks:
+                task.cancel()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, cancel_all)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.summary_pool.shutdown(wait=True)
+
+        for job, result in zip(jobs, results):
+            # Cancelled jobs were already reported by cancel_all
+            if isinstance(result, Exception):
+                print(f"{RED}[!] {job.name} failed: {type(result).__name__}: {result}{NC}")
+                self.checkpoint(job, FAILED)
+
+        return all(result is True for result in results)
+
+
+async def orchestrate(args):
+    manifest = None
+    if args.resume:
+        try:
+            manifest = CheckpointManifest.load(args.reports_dir, args.resume)
+        except FileNotFoundError:
+            print(f"{RED}[!] No scan manifest found for timestamp: {args.resume}{NC}")
+            return 1
+        # The original run's selection wins over anything on the command line
+        args.timestamp = args.resume
+        args.framework = manifest.data['framework']
+        args.profiles = manifest.data.get('profiles')
+        args.regions = manifest.data.get('regions')
+        args.baseline = manifest.data.get('baseline')
+    elif not args.framework:
+        print(f"{RED}[!] A framework is required unless --resume is given{NC}")
+        return 2
+
+    baseline = None
+    if args.framework == VERIFY_FIXES:
+        if not args.baseline:
+            print(f"{RED}[!] verify-fixes needs --baseline <timestamp|report>{NC}")
+            return 2
+        try:
+            baseline = Baseline.load(args.reports_dir, args.baseline)
+        except FileNotFoundError as e:
+            print(f"{RED}[!] {e}{NC}")
+            return 1
+        if not baseline.checks:
+            print(f"{GREEN}[✓] Baseline {args.baseline} has no failed checks, nothing to verify{NC}")
+            return 0
+        if args.profiles is None:
+            # Rescan the same accounts as the baseline scan unless told otherwise
+            try:
+                args.profiles = CheckpointManifest.load(args.reports_dir, args.baseline).data.get('profiles')
+            except (OSError, ValueError):
+                pass
+            if args.profiles:
+                print(f"{YELLOW}[*] Using profiles from baseline scan: {' '.join(args.profiles)}{NC}")
+        print(f"{YELLOW}[*] Verifying {len(baseline.checks)} failed check(s) in "
+              f"{len(baseline.regions) or 'all'} region(s) from {args.baseline}{NC}")
+
+    orchestrator = ScanOrchestrator(args.reports_dir, args.timestamp, prowler_cmd=args.prowler,
+                                    max_parallel=args.parallel, job_timeout=args.job_timeout,
+                                    summary_workers=args.summary_workers, manifest=manifest,
+                                    resume=bool(args.resume))
+
+    if not args.skip_prerequisites and not await orchestrator.check_prerequisites():
+        return 1
+
+    if manifest is not None:
+        expected = manifest.data.get('account')
+        if expected and orchestrator.account and expected != orchestrator.account:
+            print(f"{RED}[!] Credentials are for account {orchestrator.account}, "
+                  f"but scan {args.resume} was for {expected}{NC}")
+            return 1
+        print(f"{YELLOW}[*] Resuming {args.framework} scan {args.resume} "
+              f"({len(manifest.incomplete())} incomplete unit(s)){NC}")
+    else:
+        Path(args.reports_dir).mkdir(parents=True, exist_ok=True)
+        orchestrator.manifest = CheckpointManifest.create(args.reports_dir, args.timestamp, args.framework,
+                                                          args.profiles, args.regions, orchestrator.account,
+                                                          baseline=args.baseline)
+        print(f"{YELLOW}[*] Running framework: {args.framework}{NC}")
+
+    jobs = build_jobs(args.framework, args.timestamp, args.profiles, args.regions, baseline)
+    ok = await orchestrator.run(jobs)
+
+    if baseline is not None:
+        reports = [job.report_path(args.reports_dir) for job in jobs]
+        reports = [report for report in reports if report.exists()]
+        if reports:
+            if not ok:
+                print(f"{YELLOW}[!] Verification rescan incomplete; checks it did not reach are not verified{NC}")
+            save_delta(build_delta(baseline, reports, complete=ok), args.reports_dir, args.timestamp)
+    if not ok:
+        print(f"{YELLOW}[*] Resume the remaining units with: --resume {args.timestamp}{NC}")
+    return 0 if ok else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run banking compliance scans concurrently')
+    parser.add_argument('framework', nargs='?', choices=sorted(FRAMEWORKS) + [VERIFY_FIXES],
+                        help='Compliance framework to scan')
+    parser.add_argument('--reports-dir', default='reports', help='Directory for Prowler reports')
+    parser.add_argument('--timestamp', default=datetime.now().strftime('%Y%m%d_%H%M%S'),
+                        help='Timestamp for this scan (default: now)')
+    parser.add_argument('--prowler', default=os.environ.get('PROWLER_CMD', 'prowler'), help='Prowler command')
+    parser.add_argument('--profiles', nargs='*', default=None, help='AWS profiles to scan as separate shards')
+    parser.add_argument('--regions', nargs='*', default=None, help='AWS regions to scan as separate shards')
+    parser.add_argument('--parallel', type=int, default=2, help='Maximum concurrent Prowler processes')
+    parser.add_argument('--job-timeout', type=float, default=None, help='Per-scan timeout in seconds')
+    parser.add_argument('--summary-workers', type=int, default=2, help='Summary worker processes')
+    parser.add_argument('--baseline', default=None,
+                        help='verify-fixes: baseline timestamp, OCSF report or executive summary JSON')
+    parser.add_argument('--resume', metavar='TIMESTAMP', default=None,
+                        help='Re-run only the incomplete units of an earlier scan and merge them into its reports')
+    parser.add_argument('--skip-prerequisites', action='store_true', help='Skip Prowler/AWS checks')
+
+    args = parser.parse_args()
+    sys.exit(asyncio.run(orchestrate(args)))
+
+
+if __name__ == "__main__":
+    main()
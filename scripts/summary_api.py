@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Banking Compliance Summary API
+Serves executive summary aggregates over a local HTTP API with ETag caching
+and hot-reloads them when new summaries land in the reports directory
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+SUMMARY_PREFIX = 'executive_summary_'
+
+
+class SummaryStore:
+    """In-memory cache of executive summary aggregates
+
+    Summaries are loaded once and only re-read when their file changes.
+    Rendered responses are cached per generation, so repeat requests are
+    served straight from memory until the next reload.
+    """
+
+    def __init__(self, reports_dir):
+        self.reports_dir = Path(reports_dir)
+        self.lock = threading.Lock()
+        # label -> ((size, mtime), summary dict)
+        self.summaries = {}
+        self.generation = 0
+        self.responses = {}
+
+    def _snapshot(self):
+        snapshot = {}
+        try:
+            entries = os.scandir(self.reports_dir)
+        except FileNotFoundError:
+            return snapshot
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(SUMMARY_PREFIX) and name.endswith('.json')):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                label = name[len(SUMMARY_PREFIX):-len('.json')]
+                snapshot[label] = (entry.path, (stat.st_size, stat.st_mtime))
+        return snapshot
+
+    def reload(self):
+        """Re-read changed summaries; return True if anything changed"""
+        snapshot = self._snapshot()
+        loaded = {}
+        changed = False
+
+        for label, (path, signature) in snapshot.items():
+            current = self.summaries.get(label)
+            if current and current[0] == signature:
+                loaded[label] = current
+                continue
+            try:
+                with open(path, 'r') as f:
+                    summary = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Skipping {path}: {e}")
+                if current:
+                    loaded[label] = current
+                continue
+            if not isinstance(summary, dict) or 'overall_risk_score' not in summary:
+                continue
+            loaded[label] = (signature, summary)
+            changed = True
+
+        if set(loaded) != set(self.summaries):
+            changed = True
+
+        if changed:
+            with self.lock:
+                self.summaries = loaded
+                self.generation += 1
+                self.responses = {}
+        return changed
+
+    def _ordered(self):
+        return sorted(self.summaries.items(), key=lambda item: (item[1][1].get('scan_date', ''), item[0]))
+
+    def _select(self, scan):
+        if scan:
+            entry = self.summaries.get(scan)
+            return (scan, entry[1]) if entry else (None, None)
+        ordered = self._ordered()
+        if not ordered:
+            return None, None
+        label, (_, summary) = ordered[-1]
+        return label, summary
+
+    def build(self, endpoint, scan=None):
+        """Build the payload for an endpoint, or None if it does not exist"""
+        if endpoint == '/scans':
+            return {'scans': [
+                {'scan': label, 'scan_date': summary.get('scan_date')}
+                for label, (_, summary) in self._ordered()
+            ]}
+
+        if endpoint == '/trend':
+            return {'trend': [
+                {
+                    'scan': label,
+                    'scan_date': summary.get('scan_date'),
+                    'overall_risk_score': summary.get('overall_risk_score'),
+                    'passed_checks': summary.get('passed_checks'),
+                    'failed_checks': summary.get('failed_checks')
+                }
+                for label, (_, summary) in self._ordered()
+            ]}
+
+        label, summary = self._select(scan)
+        if summary is None:
+            return {'error': 'no summary found', 'scan': scan}
+
+        if endpoint == '/summary':
+            return dict(summary, scan=label)
+        if endpoint == '/categories':
+            return {'scan': label, 'categories': summary.get('categories', {})}
+        if endpoint == '/severity':
+            return {
+                'scan': label,
+                'critical': summary.get('critical_findings', 0),
+                'high': summary.get('high_findings', 0),
+                'medium': summary.get('medium_findings', 0),
+                'low': summary.get('low_findings', 0)
+            }
+        return None
+
+    def response(self, endpoint, scan=None):
+        """Return (status, body bytes, etag) for an endpoint; 200s are cached per generation"""
+        key = (endpoint, scan)
+        with self.lock:
+            cached = self.responses.get(key)
+            if cached:
+                return cached
+
+            payload = self.build(endpoint, scan)
+            if payload is None:
+                status = 404
+                payload = {'error': 'unknown endpoint',
+                           'endpoints': ['/summary', '/categories', '/severity', '/trend', '/scans']}
+            elif 'error' in payload:
+                status = 404
+            else:
+                status = 200
+
+            body = json.dumps(payload).encode('utf-8')
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            cached = (status, body, etag)
+            # Only known endpoint/scan pairs are cached, so arbitrary paths
+            # and ?scan= values cannot grow the cache between reloads
+            if status == 200:
+                self.responses[key] = cached
+            return cached
+
+
+def make_handler(store):
+    class SummaryHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            scan = parse_qs(url.query).get('scan', [None])[0]
+            endpoint = url.path.rstrip('/') or '/summary'
+            status, body, etag = store.response(endpoint, scan)
+
+            if status == 200 and self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SummaryHandler
+
+
+def watch_store(store, interval, stop):
+    """Poll the reports directory and hot-reload changed summaries"""
+    while not stop.wait(interval):
+        try:
+            if store.reload():
+                print(f"Reloaded summaries ({len(store.summaries)} scans)")
+        except Exception as e:
+            print(f"Error reloading summaries: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve banking compliance summaries over a local HTTP API')
+    parser.add_argument('--reports-dir', default='reports', help='Directory containing executive summaries')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind (default: localhost only)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--reload-interval', type=float, default=2.0,
+                        help='Seconds between checks for new summaries')
+
+    args = parser.parse_args()
+
+    store = SummaryStore(args.reports_dir)
+    store.reload()
+    print(f"Loaded {len(store.summaries)} summaries from {args.reports_dir}")
+
+    stop = threading.Event()
+    reloader = threading.Thread(target=watch_store, args=(store, args.reload_interval, stop), daemon=True)
+    reloader.start()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(store))
+    print(f"Serving on http://{args.host}:{args.port} (endpoints: /summary /categories /severity /trend /scans)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down")
+    finally:
+        stop.set()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
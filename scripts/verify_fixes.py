@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Remediation verification for banking compliance scans
+Extracts the failing checks and regions from a baseline scan and compares a
+targeted rescan against it, producing a fixed / still failing / new delta
+"""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+
+from drilldown import finding_groups
+from merge_findings import finding_key, iter_ocsf
+from report_writer import render_json, write_documents
+
+
+def verify_key(finding):
+    """(account, check, resource, region) identity of an OCSF finding"""
+    key = finding_key(finding)
+    return (finding_groups(finding, key)[0],) + key
+
+
+class Baseline:
+    """Failed findings of a previous run, loaded from OCSF reports or a summary"""
+
+    def __init__(self, source):
+        self.source = source
+        # (account, check, resource, region) keys; empty when loaded from a summary
+        self.failed = set()
+        self.checks = set()
+        self.regions = set()
+        # check -> accounts it failed in; empty when loaded from a summary
+        self.check_accounts = {}
+
+    @classmethod
+    def from_reports(cls, reports, source):
+        baseline = cls(source)
+        for report in reports:
+            for finding in iter_ocsf(report):
+                if finding.get('status_code') != 2:
+                    continue
+                key = verify_key(finding)
+                account, check, _, region = key
+                if not check:
+                    continue
+                baseline.failed.add(key)
+                baseline.checks.add(check)
+                baseline.check_accounts.setdefault(check, set()).add(account)
+                if region:
+                    baseline.regions.add(region)
+        return baseline
+
+    @classmethod
+    def from_summary(cls, summary_file):
+        """Summaries only keep the top offenders, so this is a best-effort baseline
+
+        Regions are left empty so the rescan covers every region; the top
+        offender regions would miss failures elsewhere.
+        """
+        with open(summary_file, 'r') as f:
+            summary = json.load(f)
+        baseline = cls(str(summary_file))
+        offenders = summary.get('top_offenders', {})
+        baseline.checks = {entry['key'] for entry in offenders.get('checks', [])}
+        return baseline
+
+    @classmethod
+    def load(cls, reports_dir, baseline):
+        """Resolve a baseline given as an OCSF file, a summary JSON or a timestamp"""
+        path = Path(baseline)
+        if path.is_file():
+            if path.name.endswith('.ocsf.json'):
+                return cls.from_reports([path], str(path))
+            return cls.from_summary(path)
+
+        reports = sorted(
+            p for p in Path(reports_dir).glob(f"*{baseline}*.ocsf.json")
+            if not p.name.startswith('verify_fixes_')
+        )
+        if reports:
+            return cls.from_reports(reports, baseline)
+
+        summary = Path(reports_dir) / f"executive_summary_{baseline}.json"
+        if summary.is_file():
+            print(f"No OCSF reports for {baseline}; using top offenders from {summary.name}")
+            return cls.from_summary(summary)
+
+        raise FileNotFoundError(f"No baseline reports or summary found for: {baseline}")
+
+    def prowler_selection(self):
+        """Prowler arguments that rescan only the baseline's failing checks and regions"""
+        selection = ['--check'] + sorted(self.checks)
+        if self.regions:
+            selection += ['--region'] + sorted(self.regions)
+        return selection
+
+
+def build_delta(baseline, reports, complete=True):
+    """Compare rescanned reports against the baseline failures
+
+    A baseline failure can only be fixed if the rescan produced findings for
+    its check in its account; checks or accounts the rescan never reached
+    (e.g. it failed, timed out or ran with other profiles) are listed as not
+    verified. complete=False marks a delta built from a failed rescan.
+    """
+    now_failed = set()
+    # (account, check) pairs the rescan produced findings for
+    scanned = set()
+    for report in reports:
+        for finding in iter_ocsf(report):
+            key = verify_key(finding)
+            scanned.add(key[:2])
+            if finding.get('status_code') == 2:
+                now_failed.add(key)
+
+    scanned_checks = {check for _, check in scanned}
+    failing_checks = {key[1] for key in now_failed}
+
+    def covered(check):
+        accounts = baseline.check_accounts.get(check)
+        if not accounts:
+            # Summary baselines do not record accounts
+            return check in scanned_checks
+        return all((account, check) in scanned for account in accounts)
+
+    still_failing = baseline.checks & failing_checks
+    fixed_checks = {check for check in baseline.checks - still_failing if covered(check)}
+    baseline_accounts = set().union(*baseline.check_accounts.values())
+    delta = {
+        'generated': datetime.now().isoformat(),
+        'baseline': baseline.source,
+        'complete': complete,
+        'checks_rescanned': len(baseline.checks & scanned_checks),
+        'fixed_checks': sorted(fixed_checks),
+        'still_failing_checks': sorted(still_failing),
+        'not_verified_checks': sorted(baseline.checks - still_failing - fixed_checks),
+        'not_verified_accounts': sorted(baseline_accounts - {account for account, _ in scanned}),
+    }
+
+    if baseline.failed:
+        fixed = {key for key in baseline.failed - now_failed if key[:2] in scanned}
+        # A finding that vanished from a rescanned check (e.g. resource deleted) also counts as fixed
+        delta['fixed_findings'] = len(fixed)
+        delta['still_failing_findings'] = len(baseline.failed & now_failed)
+        delta['not_verified_findings'] = sum(1 for key in baseline.failed if key[:2] not in scanned)
+        delta['new_failures'] = len(now_failed - baseline.failed)
+        delta['fixed'] = [list(key) for key in sorted(fixed)]
+        delta['new'] = [list(key) for key in sorted(now_failed - baseline.failed)]
+    return delta
+
+
+def render_delta_markdown(delta):
+    """Render the verification delta as Markdown in memory"""
+    parts = []
+    w = parts.append
+
+    w(f"# Remediation Verification\n\n")
+    w(f"**Date:** {delta['generated']}\n")
+    w(f"**Baseline:** {delta['baseline']}\n\n")
+    if not delta.get('complete', True):
+        w(f"> ⚠️ The verification rescan did not finish; unscanned checks are listed as not verified.\n\n")
+    w(f"## Checks\n")
+    w(f"- Rescanned: {delta['checks_rescanned']}\n")
+    w(f"- Fixed: {len(delta['fixed_checks'])}\n")
+    w(f"- Still Failing: {len(delta['still_failing_checks'])}\n")
+    w(f"- Not Verified: {len(delta['not_verified_checks'])}\n")
+
+    if 'fixed_findings' in delta:
+        w(f"\n## Findings\n")
+        w(f"- Fixed: {delta['fixed_findings']}\n")
+        w(f"- Still Failing: {delta['still_failing_findings']}\n")
+        w(f"- Not Verified: {delta['not_verified_findings']}\n")
+        w(f"- New Failures: {delta['new_failures']}\n")
+
+    if delta['fixed_checks']:
+        w(f"\n## ✅ Fixed Checks\n")
+        for check in delta['fixed_checks']:
+            w(f"- {check}\n")
+
+    if delta['still_failing_checks']:
+        w(f"\n## ⚠️ Still Failing\n")
+        for check in delta['still_failing_checks']:
+            w(f"- {check}\n")
+
+    if delta['not_verified_checks']:
+        w(f"\n## ❔ Not Verified\n")
+        for check in delta['not_verified_checks']:
+            w(f"- {check}\n")
+        if delta['not_verified_accounts']:
+            w(f"\nAccounts not rescanned: {', '.join(delta['not_verified_accounts'])}\n")
+
+    return ''.join(parts)
+
+
+def save_delta(delta, reports_dir, timestamp):
+    output_base = Path(reports_dir) / f"verify_delta_{timestamp}"
+
+    write_documents([
+        (f"{output_base}.json", render_json(delta)),
+        (f"{output_base}.md", render_delta_markdown(delta))
+    ])
+
+    print(f"\n✅ Verification delta saved:")
+    print(f"  - JSON: {output_base}.json")
+    print(f"  - Markdown: {output_base}.md")
+    return output_base
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare a verification rescan against a baseline scan')
+    parser.add_argument('--reports-dir', required=True, help='Directory containing Prowler reports')
+    parser.add_argument('--baseline', required=True, help='Baseline timestamp, OCSF file or summary JSON')
+    parser.add_argument('--rescan', required=True, nargs='+', help='OCSF reports from the verification rescan')
+    parser.add_argument('--timestamp', default=datetime.now().strftime('%Y%m%d_%H%M%S'),
+                        help='Timestamp for the delta report')
+
+    args = parser.parse_args(argv)
+
+    baseline = Baseline.load(args.reports_dir, args.baseline)
+    delta = build_delta(baseline, args.rescan)
+    save_delta(delta, args.reports_dir, args.timestamp)
+
+
+if __name__ == "__main__":
+    main()
@@ -71,10 +71,14 @@ if [ "$1" == "list" ]; then
     show_reports
 elif [ "$1" == "open" ]; then
     open_latest
+elif [ "$1" == "serve" ]; then
+    shift
+    python3 "$(dirname "$0")/summary_api.py" --reports-dir "$REPORTS_DIR" "$@"
 else
     show_reports
     echo ""
     echo "Usage:"
     echo "  $0 list  - List all reports"
     echo "  $0 open  - Open latest HTML report in browser"
+    echo "  $0 serve - Serve summaries as JSON on http://127.0.0.1:8765"
 fi
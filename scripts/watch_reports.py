@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Banking Compliance Report Watcher
+Watches the reports directory for new or growing Prowler OCSF outputs and
+regenerates their executive summaries as soon as each file settles
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from generate_summary import OCSF_SUFFIX, report_label, summarize_report
+
+# inotify is optional; without it the watcher polls the directory
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+
+def scan_reports(reports_dir):
+    """Snapshot {path: (size, mtime)} for every OCSF file in reports_dir"""
+    snapshot = {}
+    try:
+        entries = os.scandir(reports_dir)
+    except FileNotFoundError:
+        return snapshot
+
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(OCSF_SUFFIX) or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[entry.path] = (stat.st_size, stat.st_mtime)
+    return snapshot
+
+
+class ReportWatcher:
+    """Debounced watcher that hands settled OCSF files to a worker pool
+
+    A file is considered settled once its size and mtime have not changed
+    for `debounce` seconds. Files that grow again after being summarized
+    are picked up and summarized again.
+    """
+
+    def __init__(self, reports_dir, debounce=5.0, poll_interval=2.0, workers=2,
+                 use_inotify=True, summary_options=None):
+        self.reports_dir = Path(reports_dir)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.workers = workers
+        self.summary_options = summary_options or {}
+        self.inotify = None
+
+        if use_inotify and INotify is not None:
+            self.inotify = INotify()
+            watch_flags = (inotify_flags.CREATE | inotify_flags.MODIFY |
+                           inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+            self.inotify.add_watch(str(self.reports_dir), watch_flags)
+
+        # path -> (size, mtime) of the version last summarized
+        self.processed = {}
+        # path -> ((size, mtime), time the signature last changed)
+        self.pending = {}
+        # path -> (Future, (size, mtime)) for summaries currently running
+        self.running = {}
+        # path -> (size, mtime) of the version whose summary last failed
+        self.failed = {}
+
+    def _wait_for_changes(self):
+        """Block until something may have changed; return True if it did"""
+        if self.inotify is None:
+            time.sleep(self.poll_interval)
+            return True
+
+        events = self.inotify.read(timeout=int(self.poll_interval * 1000))
+        return any(event.name.endswith(OCSF_SUFFIX) for event in events)
+
+    def _seed_processed(self):
+        """Skip reports whose summary is already newer than the report"""
+        for path, signature in scan_reports(self.reports_dir).items():
+            summary = self.reports_dir / f"executive_summary_{report_label(path)}.json"
+            try:
+                if summary.stat().st_mtime >= signature[1]:
+                    self.processed[path] = signature
+            except FileNotFoundError:
+                continue
+
+    def _refresh_pending(self, now):
+        for path, signature in scan_reports(self.reports_dir).items():
+            if self.processed.get(path) == signature or self.failed.get(path) == signature:
+                continue
+            previous = self.pending.get(path)
+            if previous is None or previous[0] != signature:
+                self.pending[path] = (signature, now)
+
+    def _settled(self, now):
+        ready = []
+        for path, (signature, changed_at) in list(self.pending.items()):
+            if path in self.running:
+                continue
+            if now - changed_at >= self.debounce:
+                ready.append((path, signature))
+        return ready
+
+    def _reap(self):
+        for path, (future, signature) in list(self.running.items()):
+            if not future.done():
+                continue
+            del self.running[path]
+            try:
+                future.result()
+                self.processed[path] = signature
+                self.failed.pop(path, None)
+                print(f"✅ Summary refreshed for {Path(path).name}")
+            except Exception as e:
+                print(f"Error summarizing {path}: {e}")
+                # Retry only once the file changes again
+                self.failed[path] = signature
+
+            # Only drop the pending entry if the file did not change mid-run
+            pending = self.pending.get(path)
+            if pending and pending[0] == signature:
+                del self.pending[path]
+
+    def run(self, once=False):
+        """Watch until interrupted (or until the backlog drains with once=True)"""
+        backend = 'inotify' if self.inotify is not None else 'polling'
+        print(f"Watching {self.reports_dir} for OCSF reports ({backend}, debounce {self.debounce}s)")
+
+        self._seed_processed()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            self._refresh_pending(time.monotonic())
+            while True:
+                now = time.monotonic()
+                for path, signature in self._settled(now):
+                    print(f"Regenerating summary for {Path(path).name}...")
+                    future = pool.submit(summarize_report, str(self.reports_dir), path,
+                                         report_label(path), **self.summary_options)
+                    self.running[path] = (future, signature)
+
+                self._reap()
+
+                if once and not self.pending and not self.running:
+                    return
+
+                if self.running or self.pending:
+                    # Keep ticking while debounce timers and jobs are outstanding
+                    time.sleep(min(self.poll_interval, 0.5))
+                    changed = True
+                else:
+                    changed = self._wait_for_changes()
+
+                if changed:
+                    self._refresh_pending(time.monotonic())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Regenerate banking compliance summaries as scan outputs land')
+    parser.add_argument('--reports-dir', default='reports', help='Directory containing Prowler reports')
+    parser.add_argument('--debounce', type=float, default=5.0,
+                        help='Seconds a report must stay unchanged before it is summarized')
+    parser.add_argument('--poll-interval', type=float, default=2.0, help='Polling interval in seconds')
+    parser.add_argument('--workers', type=int, default=2, help='Number of summary worker processes')
+    parser.add_argument('--no-inotify', action='store_true', help='Force the polling backend')
+    parser.add_argument('--once', action='store_true',
+                        help='Summarize existing unsummarized reports, then exit')
+
+    args = parser.parse_args()
+
+    watcher = ReportWatcher(args.reports_dir, debounce=args.debounce, poll_interval=args.poll_interval,
+                            workers=args.workers, use_inotify=not args.no_inotify)
+    try:
+        watcher.run(once=args.once)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()